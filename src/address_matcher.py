@@ -13,11 +13,15 @@ using fuzzy matching algorithms.
 """
 
 # Standard library imports
+import logging
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
 
 # Third-party imports
-from fuzzywuzzy import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
+from selectolax.lexbor import LexborHTMLParser
 
 # Local imports
 from src.config.logging_config import get_logger
@@ -25,11 +29,65 @@ from src.config.logging_config import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
-
+# Precompiled patterns
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_HTML_RE = re.compile(r"<[^>]+>")
+
+# Street-type abbreviations expanded by normalize_address
+_ABBREV_MAP = {
+    "st": "street",
+    "rd": "road",
+    "ave": "avenue",
+    "dr": "drive",
+    "ln": "lane",
+    "blvd": "boulevard",
+}
+_ABBREV_RE = re.compile(r"\b(st|rd|ave|dr|ln|blvd)\b\.?")
+
+# UK: AA9A 9AA, A9A 9AA, A9 9AA, A99 9AA, AA9 9AA, AA99 9AA
+# US: 99999, 99999-9999
+_UK_POSTCODE = r"[A-Z]{1,2}[0-9][A-Z0-9]? ?[0-9][A-Z]{2}"
+_US_ZIPCODE = r"[0-9]{5}(?:-[0-9]{4})?"
+
+# Postal code patterns tried in order when parsing a single address
+_POSTAL_COMPONENT_RES = [
+    re.compile(rf"\b{_UK_POSTCODE}\b", re.IGNORECASE),
+    re.compile(rf"\b{_US_ZIPCODE}\b", re.IGNORECASE),
+]
+
+_BUILDING_RE = re.compile(r"^\s*(\d+[-\w]*)\s")
+_STREET_RE = re.compile(
+    r"\d+\s+([A-Za-z\s]+?)(?:\s+(?:road|street|avenue|lane|drive|place|way|boulevard|rd|st|ave|ln|dr|pl|blvd))?",
+    re.IGNORECASE,
+)
+
+# Single pass over free text: postal codes, plus street patterns for
+# addresses without postal codes
+_STREET_TYPES = r"(?:Road|Street|Avenue|Lane|Drive|Plaza|Square|Court)"
+_ADDRESS_CANDIDATE_RE = re.compile(
+    rf"(?P<postal>{_UK_POSTCODE}|{_US_ZIPCODE})"
+    rf"|(?P<street>\d+\s+[A-Za-z\s]+{_STREET_TYPES}\b)"
+    rf"|(?P<street_number>\b{_STREET_TYPES}\b\s+\d+)",
+    re.IGNORECASE,
+)
+
+# Characters of context kept before a match, by match type
+_CONTEXT_BEFORE = {"postal": 100, "street": 50, "street_number": 50}
+_CONTEXT_AFTER = 100
+
+# Length of the lowercased context prefix used to detect duplicate candidates
+_DEDUP_KEY_LENGTH = 80
+
+
+@lru_cache(maxsize=8192)
 def normalize_address(address: str) -> str:
     """
     Normalize an address string for better comparison.
 
+    Results are memoized, since the same reference address is normalized
+    for every candidate and candidates often recur across merchants.
+
     This function:
     - Converts to lowercase
     - Removes punctuation
@@ -48,30 +106,14 @@ def normalize_address(address: str) -> str:
     # Convert to lowercase
     address = address.lower()
 
-    # Replace common abbreviations
-    replacements = {
-        "st.": "street",
-        "st ": "street ",
-        "rd.": "road",
-        "rd ": "road ",
-        "ave.": "avenue",
-        "ave ": "avenue ",
-        "dr.": "drive",
-        "dr ": "drive ",
-        "ln.": "lane",
-        "ln ": "lane ",
-        "blvd.": "boulevard",
-        "blvd ": "boulevard ",
-    }
-
-    for old, new in replacements.items():
-        address = address.replace(old, new)
+    # Replace common abbreviations (whole words only)
+    address = _ABBREV_RE.sub(lambda m: _ABBREV_MAP[m.group(1)], address)
 
     # Remove punctuation except for postal code patterns
-    address = re.sub(r"[^\w\s]", " ", address)
+    address = _PUNCT_RE.sub(" ", address)
 
     # Standardize whitespace
-    address = re.sub(r"\s+", " ", address).strip()
+    address = _WS_RE.sub(" ", address).strip()
 
     return address
 
@@ -99,36 +141,149 @@ def extract_address_components(address: str) -> Dict[str, str]:
     if not address:
         return components
 
-    # Extract postal/zip code - this pattern matches common formats
-    # UK: AA9A 9AA, A9A 9AA, A9 9AA, A99 9AA, AA9 9AA, AA99 9AA
-    # US: 99999, 99999-9999
-    # Can be extended for other countries
-    postal_patterns = [
-        r"\b[A-Z]{1,2}[0-9][A-Z0-9]? ?[0-9][A-Z]{2}\b",  # UK
-        r"\b[0-9]{5}(?:-[0-9]{4})?\b",  # US
-    ]
-
-    for pattern in postal_patterns:
-        postal_match = re.search(pattern, address, re.IGNORECASE)
+    # Extract postal/zip code - UK formats first, then US
+    # Can be extended for other countries via _POSTAL_COMPONENT_RES
+    for pattern in _POSTAL_COMPONENT_RES:
+        postal_match = pattern.search(address)
         if postal_match:
             components["postal_code"] = postal_match.group(0)
             break
 
     # Extract building number (typically at the beginning of an address)
-    building_match = re.search(r"^\s*(\d+[-\w]*)\s", address)
+    building_match = _BUILDING_RE.search(address)
     if building_match:
         components["building_number"] = building_match.group(1)
 
     # Simple street extraction (this is a basic approach)
     # More sophisticated parsing would require a dedicated address parsing library
-    street_pattern = r"\d+\s+([A-Za-z\s]+?)(?:\s+(?:road|street|avenue|lane|drive|place|way|boulevard|rd|st|ave|ln|dr|pl|blvd))?"
-    street_match = re.search(street_pattern, address, re.IGNORECASE)
+    street_match = _STREET_RE.search(address)
     if street_match:
         components["street"] = street_match.group(1).strip()
 
     return components
 
 
+def _prep_reference(reference_address: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """
+    Precompute the parts of a structured reference address used for scoring.
+
+    Args:
+        reference_address: Dictionary containing structured address data
+
+    Returns:
+        Tuple of (normalized reference string, lowercased postcode,
+        lowercased town, lowercased street line)
+    """
+    street = reference_address.get("address_line1", "")
+    town = reference_address.get("town", "")
+    postcode = reference_address.get("postcode", "")
+    country = reference_address.get("country", "")
+
+    ref_parts = [street, town, postcode, country]
+    reference_string = normalize_address(" ".join([p for p in ref_parts if p]))
+
+    return (
+        reference_string,
+        postcode.strip().lower(),
+        town.strip().lower(),
+        street.strip().lower(),
+    )
+
+
+def _combine_scores(
+    overall_score: Union[int, np.ndarray],
+    has_postal_match: Union[bool, np.ndarray],
+    has_town_match: Union[bool, np.ndarray],
+    has_street_match: Union[bool, np.ndarray],
+    require_postal_match: bool = True,
+) -> Union[int, np.ndarray]:
+    """
+    Combine the overall similarity score with component-match bonuses.
+
+    Works on scalars for a single comparison or on NumPy arrays to score
+    a batch of candidates in one pass.
+
+    Args:
+        overall_score: Fuzzy similarity score(s) between 0 and 100
+        has_postal_match: Whether the postal code was found
+        has_town_match: Whether the town was found
+        has_street_match: Whether the street closely matched
+        require_postal_match: Whether to cap confidence when postal code is missing
+
+    Returns:
+        Final confidence score(s), capped at 100
+    """
+    # Adjust confidence based on component matches
+    confidence = (
+        overall_score
+        + 20 * has_postal_match
+        + 15 * has_town_match
+        + 10 * has_street_match
+    )
+
+    # Cap at 100
+    confidence = np.minimum(confidence, 100)
+
+    # If postal match is required but missing, cap confidence
+    if require_postal_match:
+        confidence = np.where(has_postal_match, confidence, np.minimum(confidence, 60))
+
+    return confidence
+
+
+def _score_candidate(
+    prepped_reference: Tuple[str, str, str, str],
+    normalized_candidate: str,
+    require_postal_match: bool = True,
+) -> int:
+    """
+    Score a single normalized candidate against a prepared reference address.
+
+    Args:
+        prepped_reference: Output of _prep_reference for the reference address
+        normalized_candidate: Normalized candidate address string
+        require_postal_match: Whether to require postal code to match for a high confidence
+
+    Returns:
+        Confidence score between 0 and 100
+    """
+    reference_string, postcode, town, street = prepped_reference
+
+    # Initial score based on overall similarity
+    overall_score = round(fuzz.token_sort_ratio(reference_string, normalized_candidate))
+
+    # normalized_candidate is already lowercase, as are the prepped components
+    has_postal_match = bool(postcode) and postcode in normalized_candidate
+    has_town_match = bool(town) and town in normalized_candidate
+    has_street_match = (
+        bool(street) and fuzz.partial_ratio(street, normalized_candidate) > 70
+    )
+
+    # Calculate final confidence score
+    confidence = int(
+        _combine_scores(
+            overall_score,
+            has_postal_match,
+            has_town_match,
+            has_street_match,
+            require_postal_match,
+        )
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Address comparison - Overall: %d, Postal: %s, Town: %s, Street: %s, "
+            "Final: %d",
+            overall_score,
+            has_postal_match,
+            has_town_match,
+            has_street_match,
+            confidence,
+        )
+
+    return confidence
+
+
 def compare_addresses(
     reference_address: Dict[str, Any],
     candidate_address: str,
@@ -151,53 +306,8 @@ def compare_addresses(
     # Normalize the candidate address
     normalized_candidate = normalize_address(candidate_address)
 
-    # Create a normalized reference address string
-    ref_parts = [
-        reference_address.get("address_line1", ""),
-        reference_address.get("town", ""),
-        reference_address.get("postcode", ""),
-        reference_address.get("country", ""),
-    ]
-    reference_string = normalize_address(" ".join([p for p in ref_parts if p]))
-
-    # Initial score based on overall similarity
-    overall_score = fuzz.token_sort_ratio(reference_string, normalized_candidate)
-
-    # Check for postal code match
-    postcode = reference_address.get("postcode", "").strip()
-    has_postal_match = postcode and postcode.lower() in normalized_candidate.lower()
-
-    # Check for town/city match
-    town = reference_address.get("town", "").strip().lower()
-    has_town_match = town and town in normalized_candidate.lower()
-
-    # Check for street match
-    street = reference_address.get("address_line1", "").strip().lower()
-    has_street_match = (
-        street and fuzz.partial_ratio(street, normalized_candidate.lower()) > 70
-    )
-
-    # Calculate final confidence score
-    confidence = overall_score
-
-    # Adjust confidence based on component matches
-    if has_postal_match:
-        confidence += 20
-    if has_town_match:
-        confidence += 15
-    if has_street_match:
-        confidence += 10
-
-    # Cap at 100
-    confidence = min(confidence, 100)
-
-    # If postal match is required but missing, cap confidence
-    if require_postal_match and not has_postal_match:
-        confidence = min(confidence, 60)
-
-    logger.debug(
-        f"Address comparison - Overall: {overall_score}, Postal: {has_postal_match}, "
-        f"Town: {has_town_match}, Street: {has_street_match}, Final: {confidence}"
+    confidence = _score_candidate(
+        _prep_reference(reference_address), normalized_candidate, require_postal_match
     )
 
     return confidence, candidate_address
@@ -215,56 +325,75 @@ def extract_addresses_from_text(text: str) -> List[str]:
     Returns:
         List of potential address strings
     """
-    # Clean the text (remove HTML tags)
-    clean_text = re.sub(r"<[^>]+>", " ", text)
-    clean_text = re.sub(r"\s+", " ", clean_text).strip()
+    # Clean the text (remove HTML tags), parsing anything that looks like markup
+    if "<" in text[:512]:
+        clean_text = " ".join(LexborHTMLParser(text).text(separator=" ").split())
+    else:
+        clean_text = _HTML_RE.sub(" ", text)
+        clean_text = _WS_RE.sub(" ", clean_text).strip()
 
     # List to store potential addresses
     potential_addresses = []
+    seen = set()
 
-    # UK postcode pattern
-    uk_postcode = r"[A-Z]{1,2}[0-9][A-Z0-9]? ?[0-9][A-Z]{2}"
-
-    # US zip code pattern
-    us_zipcode = r"[0-9]{5}(?:-[0-9]{4})?"
+    # Scan once for postal codes and street patterns
+    for match in _ADDRESS_CANDIDATE_RE.finditer(clean_text):
+        # Extract text before and after the match (context window)
+        pos = match.start()
+        start = max(0, pos - _CONTEXT_BEFORE[match.lastgroup])
+        end = min(len(clean_text), pos + _CONTEXT_AFTER)
+        context = clean_text[start:end]
 
-    # Combined pattern
-    postal_pattern = f"({uk_postcode}|{us_zipcode})"
+        # Only add if it's not a duplicate of an existing entry
+        key = context.lower()[:_DEDUP_KEY_LENGTH]
+        if key not in seen:
+            seen.add(key)
+            potential_addresses.append(context)
 
-    # Find all postal code matches
-    postal_matches = re.finditer(postal_pattern, clean_text, re.IGNORECASE)
+    return potential_addresses
 
-    for match in postal_matches:
-        # Get the position of the postal code
-        pos = match.start()
 
-        # Extract text before and after (context window)
-        start = max(0, pos - 100)
-        end = min(len(clean_text), pos + 100)
+def _score_candidates(
+    prepped_reference: Tuple[str, str, str, str],
+    normalized_candidates: List[str],
+    has_postal_match: np.ndarray,
+) -> np.ndarray:
+    """
+    Score a batch of normalized candidates against a reference address.
 
-        # Extract the context and add to potential addresses
-        context = clean_text[start:end]
-        potential_addresses.append(context)
-
-    # Additional patterns for addresses without postal codes
-    address_patterns = [
-        r"\d+\s+[A-Za-z\s]+(?:Road|Street|Avenue|Lane|Drive|Plaza|Square|Court)\b",
-        r"\b(?:Road|Street|Avenue|Lane|Drive|Plaza|Square|Court)\b\s+\d+",
-    ]
-
-    for pattern in address_patterns:
-        matches = re.finditer(pattern, clean_text, re.IGNORECASE)
-        for match in matches:
-            pos = match.start()
-            start = max(0, pos - 50)
-            end = min(len(clean_text), pos + 100)
-            context = clean_text[start:end]
-
-            # Only add if it's not too similar to existing entries
-            if not any(fuzz.ratio(context, addr) > 80 for addr in potential_addresses):
-                potential_addresses.append(context)
+    Args:
+        prepped_reference: Output of _prep_reference for the reference address
+        normalized_candidates: Normalized candidate address strings
+        has_postal_match: Whether each candidate contains the reference postcode
 
-    return potential_addresses
+    Returns:
+        Array of confidence scores, one per candidate
+    """
+    reference_string, _, town, street = prepped_reference
+
+    # Score every candidate against the reference in a single batched call
+    overall_scores = process.cdist(
+        [reference_string],
+        normalized_candidates,
+        scorer=fuzz.token_sort_ratio,
+        workers=-1,
+    )[0].round()
+
+    has_town_match = np.array([bool(town) and town in c for c in normalized_candidates])
+    if street:
+        has_street_match = (
+            process.cdist(
+                [street], normalized_candidates, scorer=fuzz.partial_ratio, workers=-1
+            )[0]
+            > 70
+        )
+    else:
+        has_street_match = np.zeros(len(normalized_candidates), dtype=bool)
+
+    # Apply the same bonuses and caps as compare_addresses, vectorized
+    return _combine_scores(
+        overall_scores, has_postal_match, has_town_match, has_street_match
+    )
 
 
 def find_best_address_match(
@@ -287,16 +416,44 @@ def find_best_address_match(
     if not potential_addresses:
         return 0, None
 
-    # Compare each potential address with the reference
-    best_score = 0
-    best_match = None
+    # Reference fields are invariant across candidates, so prepare them once
+    prepped_reference = _prep_reference(reference_address)
+    postcode = prepped_reference[1]
+    normalized_candidates = [normalize_address(a) for a in potential_addresses]
+
+    has_postal_match = np.array(
+        [bool(postcode) and postcode in c for c in normalized_candidates]
+    )
 
-    for address in potential_addresses:
-        score, match = compare_addresses(reference_address, address)
+    # Candidates without the postal code are capped at 60, so once a candidate
+    # containing it scores above that the rest cannot win and are not scored
+    candidate_indices = np.flatnonzero(has_postal_match)
+    confidences = None
+    if len(candidate_indices):
+        confidences = _score_candidates(
+            prepped_reference,
+            [normalized_candidates[i] for i in candidate_indices],
+            has_postal_match[candidate_indices],
+        )
+        if confidences.max() <= 60:
+            confidences = None
+
+    if confidences is None:
+        candidate_indices = np.arange(len(normalized_candidates))
+        confidences = _score_candidates(
+            prepped_reference, normalized_candidates, has_postal_match
+        )
+
+    best_index = int(candidate_indices[np.argmax(confidences)])
+    best_score = int(confidences.max())
+    best_match = potential_addresses[best_index] if best_score > 0 else None
 
-        if score > best_score:
-            best_score = score
-            best_match = match
+    logger.debug(
+        "Best address candidate %d/%d scored %d",
+        best_index + 1,
+        len(potential_addresses),
+        best_score,
+    )
 
     # Return None if confidence is below minimum
     if best_score < min_confidence:
@@ -14,6 +14,8 @@ appropriate log levels, and log file management.
 # Standard library imports
 import os
 import sys
+import queue
+import atexit
 import logging
 import datetime
 from logging import handlers
@@ -25,6 +27,22 @@ DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 DEFAULT_LOG_DIR = "logs"
 
+# Background listener that drains queued records to the log file
+_queue_listener: Optional[handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background file-logging listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(
     log_level: Union[int, str] = DEFAULT_LOG_LEVEL,
@@ -52,6 +70,8 @@ def setup_logging(
     Returns:
         Root logger configured with appropriate handlers
     """
+    global _queue_listener
+
     # Convert string log level to numeric if needed
     if isinstance(log_level, str):
         log_level = getattr(logging, log_level.upper(), DEFAULT_LOG_LEVEL)
@@ -63,6 +83,13 @@ def setup_logging(
     # Remove any existing handlers to avoid duplicates during reconfiguration
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
+
+    # Only collect thread and process details on every LogRecord when the
+    # format shows them
+    logging.logThreads = "%(thread" in log_format
+    logging.logProcesses = "%(process)" in log_format
+    logging.logMultiprocessing = "%(processName)" in log_format
 
     # Create formatter
     formatter = logging.Formatter(log_format, date_format)
@@ -93,7 +120,15 @@ def setup_logging(
         )
         file_handler.setFormatter(formatter)
         file_handler.setLevel(log_level)
-        root_logger.addHandler(file_handler)
+
+        # Write to the file from a background thread so log calls only enqueue
+        log_queue = queue.Queue(-1)
+        queue_handler = handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(log_level)
+        root_logger.addHandler(queue_handler)
+
+        _queue_listener = handlers.QueueListener(log_queue, file_handler)
+        _queue_listener.start()
 
     # Log initial message
     root_logger.info(f"Logging initialized at level {logging.getLevelName(log_level)}")
@@ -12,11 +12,17 @@ to prepare it for the verification process.
 """
 
 # Standard library imports
+import glob
+import hashlib
+import logging
 import os
+import re
 from typing import Dict, Optional, Any
 
 # Third-party imports
+import numpy as np
 import pandas as pd
+from pandas.errors import ParserError
 
 # Local imports
 from src.config.logging_config import get_logger
@@ -24,8 +30,188 @@ from src.config.logging_config import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+# Workbook formats openpyxl can stream in read-only mode
+_OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm", ".xltx", ".xltm")
+_OPENPYXL_READ_ONLY_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
 
-def extract_merchant_data(file_path: str) -> pd.DataFrame:
+# Arrow-backed strings keep text in contiguous buffers instead of Python objects
+_STRING_DTYPE = "string[pyarrow]"
+
+# Output formats supported by export_merchants_to_excel, with their names
+_EXPORT_FORMATS = {"xlsx": "Excel", "parquet": "Parquet", "feather": "Feather"}
+
+# Other Excel file extensions exported in the "xlsx" format. xlsxwriter only
+# writes .xlsx, so these are left to pandas' engine for the extension.
+_OTHER_EXCEL_EXTENSIONS = (".xlsm", ".xls")
+
+# Source sheet column positions and the merchant fields they hold
+_MERCHANT_COLUMNS = {
+    16: "merchant_id",
+    18: "merchant_name",
+    30: "address_line1",
+    31: "postcode",
+}
+_REQUIRED_COLUMNS = [16, 18]  # merchant_id and merchant_name columns
+
+# merchant_id values treated as empty (None matches missing values)
+_EMPTY_ID_TOKENS = frozenset({"", "nan", "None", None})
+
+# Directory for the Parquet cache of parsed workbooks, used when
+# extract_merchant_data is not given a cache_dir (unset disables the cache)
+PARQUET_CACHE_DIR_ENV = "MERCHANT_VERIFIER_CACHE_DIR"
+
+# Bump when the way sheets are read changes, so older cache entries are ignored
+_PARQUET_CACHE_VERSION = 1
+
+
+def _parquet_cache_prefix(file_path: str) -> str:
+    """
+    Get the cache file name prefix shared by all entries for one workbook.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        Workbook file name followed by a hash of its absolute path
+    """
+    source = os.path.abspath(file_path)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    return f"{os.path.basename(source)}-{digest}"
+
+
+def _parquet_cache_path(file_path: str, stat: os.stat_result, cache_dir: str) -> str:
+    """
+    Get the Parquet cache path for a workbook.
+
+    Entries are keyed by the cache format version and the workbook's mtime
+    and size, so editing the workbook or changing how sheets are read moves
+    to a new entry.
+
+    Args:
+        file_path: Path to the Excel file
+        stat: Result of os.stat on the Excel file
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        Path of the cache file
+    """
+    return os.path.join(
+        cache_dir,
+        f"{_parquet_cache_prefix(file_path)}.v{_PARQUET_CACHE_VERSION}"
+        f".{stat.st_mtime_ns}_{stat.st_size}.parquet",
+    )
+
+
+def _write_parquet_cache(
+    data_df: pd.DataFrame, file_path: str, cache_path: str
+) -> None:
+    """
+    Write parsed sheet data to the cache and remove older entries for the workbook.
+
+    Failures are logged rather than raised, since the cache is only an
+    optimization.
+
+    Args:
+        data_df: Merchant columns read from the workbook
+        file_path: Path to the Excel file
+        cache_path: Path of the cache file to write
+    """
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        data_df.to_parquet(cache_path, compression="zstd", index=False)
+    except Exception as e:
+        logger.warning("Could not write merchant cache %s: %s", cache_path, e)
+        return
+
+    pattern = os.path.join(
+        glob.escape(cache_dir), f"{glob.escape(_parquet_cache_prefix(file_path))}.*"
+    )
+    for old_path in glob.glob(pattern):
+        if old_path != cache_path:
+            try:
+                os.remove(old_path)
+            except OSError as e:
+                logger.debug("Could not remove stale cache %s: %s", old_path, e)
+
+
+def _read_merchant_sheet(file_path: str, **read_kwargs: Any) -> pd.DataFrame:
+    """
+    Read the first worksheet of a merchant Excel file.
+
+    Sheets are parsed with the Rust-based calamine engine. If python-calamine
+    is unavailable, workbooks openpyxl understands are opened in read-only
+    mode, which streams rows instead of building the whole workbook in memory,
+    and other formats are left to pandas' default engine selection.
+
+    Args:
+        file_path: Path to the Excel file
+        **read_kwargs: Extra keyword arguments passed to pd.read_excel
+
+    Returns:
+        DataFrame with the sheet contents
+    """
+    try:
+        return pd.read_excel(file_path, sheet_name=0, engine="calamine", **read_kwargs)
+    except ImportError as e:
+        logger.debug("Calamine engine unavailable, falling back: %s", e)
+
+    if file_path.lower().endswith(_OPENPYXL_EXTENSIONS):
+        try:
+            return pd.read_excel(
+                file_path,
+                sheet_name=0,
+                engine="openpyxl",
+                engine_kwargs=_OPENPYXL_READ_ONLY_KWARGS,
+                **read_kwargs,
+            )
+        except TypeError as e:
+            logger.debug("Read-only load unsupported, using default engine: %s", e)
+
+    return pd.read_excel(file_path, sheet_name=0, **read_kwargs)
+
+
+def _read_merchant_columns(file_path: str) -> pd.DataFrame:
+    """
+    Read the merchant columns of a workbook, skipping the row after the header.
+
+    Args:
+        file_path: Path to the Excel file
+
+    Returns:
+        DataFrame of strings with a column per available merchant field
+
+    Raises:
+        ValueError: If the sheet is missing required columns
+    """
+    try:
+        data_df = _read_merchant_sheet(
+            file_path,
+            usecols=list(_MERCHANT_COLUMNS),
+            skiprows=[1],
+            dtype=_STRING_DTYPE,
+        )
+        data_df.columns = list(_MERCHANT_COLUMNS.values())
+        return data_df
+    except ParserError:
+        # Narrower sheets stop before the optional address columns
+        raw_df = _read_merchant_sheet(file_path, skiprows=[1], dtype=_STRING_DTYPE)
+
+    # Check if the dataframe has the required columns
+    if raw_df.shape[1] <= max(_REQUIRED_COLUMNS):
+        error_msg = f"Excel file doesn't have required columns. Expected at least {max(_REQUIRED_COLUMNS) + 1} columns, got {raw_df.shape[1]}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+    available = [c for c in _MERCHANT_COLUMNS if c < raw_df.shape[1]]
+    data_df = raw_df.iloc[:, available]
+    data_df.columns = [_MERCHANT_COLUMNS[c] for c in available]
+    return data_df
+
+
+def extract_merchant_data(
+    file_path: str, cache_dir: Optional[str] = None
+) -> pd.DataFrame:
     """
     Extract merchant data from Excel file.
 
@@ -39,8 +225,15 @@ def extract_merchant_data(file_path: str) -> pd.DataFrame:
     - Column 30 (index 30): address (if available)
     - Column 31 (index 31): postcode (if available)
 
+    Parsing the workbook dominates the run time, so the parsed columns can be
+    cached as Parquet in cache_dir and reused while the workbook is unchanged.
+    Cleaning still runs on every call.
+
     Args:
         file_path: Path to the Excel file containing merchant data
+        cache_dir: Directory for the Parquet cache (defaults to the
+            MERCHANT_VERIFIER_CACHE_DIR environment variable; caching is off
+            when neither is set)
 
     Returns:
         DataFrame containing structured merchant information
@@ -49,76 +242,72 @@ def extract_merchant_data(file_path: str) -> pd.DataFrame:
         FileNotFoundError: If the specified file does not exist
         ValueError: If the file format is invalid or missing required columns
     """
-    logger.info(f"Extracting merchant data from: {file_path}")
+    logger.info("Extracting merchant data from: %s", file_path)
 
-    # Verify the file exists
-    if not os.path.exists(file_path):
+    # Verify the file exists; the same stat call keys the Parquet cache
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError:
         error_msg = f"Excel file not found: {file_path}"
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
 
+    # Reuse the sheet parsed by a previous run if the workbook is unchanged
+    data_df = None
+    cache_path = None
+    if cache_dir is None:
+        cache_dir = os.environ.get(PARQUET_CACHE_DIR_ENV)
+    if cache_dir:
+        cache_path = _parquet_cache_path(file_path, file_stat, cache_dir)
+        try:
+            # Parquet round-trips strings as Python-backed; restore Arrow storage
+            data_df = pd.read_parquet(cache_path).astype(_STRING_DTYPE)
+            logger.info("Loaded parsed workbook from cache: %s", cache_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Ignoring unreadable merchant cache %s: %s", cache_path, e)
+
     try:
-        # Load Excel file with pandas
-        df = pd.read_excel(file_path)
-        logger.debug(f"Loaded Excel with {df.shape[0]} rows and {df.shape[1]} columns")
+        if data_df is None:
+            data_df = _read_merchant_columns(file_path)
+            if cache_path:
+                _write_parquet_cache(data_df, file_path, cache_path)
+
+        logger.debug("Loaded %d data rows from Excel", len(data_df))
 
         # DEBUG: Print the first few rows to understand the structure
-        logger.debug("First few rows of the Excel file:")
-        for i in range(min(4, df.shape[0])):
-            # Show key columns
-            row_info = {}
-            if df.shape[1] > 16:
-                row_info["col_16"] = df.iloc[i, 16]
-            if df.shape[1] > 18:
-                row_info["col_18"] = df.iloc[i, 18]
-            if df.shape[1] > 30:
-                row_info["col_30"] = df.iloc[i, 30]
-            logger.debug(f"Row {i}: {row_info}")
-
-        # Skip header row (1 row) - start from row index 1
-        data_df = df.iloc[1:].reset_index(drop=True)
-        logger.debug(f"After skipping 1 header row, have {len(data_df)} data rows")
-
-        # Check if the dataframe has the required columns
-        required_columns = [16, 18]  # merchant_id and merchant_name columns
-        if df.shape[1] <= max(required_columns):
-            error_msg = f"Excel file doesn't have required columns. Expected at least {max(required_columns) + 1} columns, got {df.shape[1]}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First few rows of the Excel file:\n%s", data_df.head(4))
 
         # Extract merchant data from the correct columns
         merchants_data = {
-            "merchant_id": data_df.iloc[:, 16],  # Column 16
-            "merchant_name": data_df.iloc[:, 18],  # Column 18
-            "merchant_legal_name": data_df.iloc[
-                :, 18
-            ],  # Reusing merchant_name as legal name
+            "merchant_id": data_df["merchant_id"],
+            "merchant_name": data_df["merchant_name"],
+            # Reusing merchant_name as legal name
+            "merchant_legal_name": data_df["merchant_name"],
             "industry": "Retail",  # Default value
             "sub_industry": "Field Sales",  # Default value
             "merchant_industry": "Retail",  # Default value
-            "address_line1": "",  # Default empty
-            "postcode": "",  # Default empty
+            # Address and postcode only if available (columns 30 and 31)
+            "address_line1": data_df.get("address_line1", ""),
+            "postcode": data_df.get("postcode", ""),
             "town": "",  # Default empty
             "country": "FRANCE",  # Default value based on your data
         }
 
-        # Add address and postcode if available (columns 30 and 31)
-        if df.shape[1] > 30:
-            merchants_data["address_line1"] = data_df.iloc[:, 30]
-        if df.shape[1] > 31:
-            merchants_data["postcode"] = data_df.iloc[:, 31]
-
         merchants = pd.DataFrame(merchants_data)
 
         # DEBUG: Print extracted data before cleaning
-        logger.debug("Extracted merchant data before cleaning:")
-        logger.debug(f"Merchant IDs: {merchants['merchant_id'].tolist()}")
-        logger.debug(f"Merchant Names: {merchants['merchant_name'].tolist()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted merchant data before cleaning:")
+            logger.debug("Merchant IDs: %s", merchants["merchant_id"].tolist())
+            logger.debug("Merchant Names: %s", merchants["merchant_name"].tolist())
 
         # Clean data
         merchants = _clean_merchant_data(merchants)
 
-        logger.info(f"Successfully extracted {len(merchants)} merchant records")
+        logger.info("Successfully extracted %d merchant records", len(merchants))
         return merchants
 
     except Exception as e:
@@ -127,6 +316,19 @@ def extract_merchant_data(file_path: str) -> pd.DataFrame:
         raise ValueError(error_msg)
 
 
+def _is_blank(values: pd.Series) -> pd.Series:
+    """
+    Flag empty or whitespace-only strings without building stripped copies.
+
+    Args:
+        values: Series of strings with no missing values
+
+    Returns:
+        Boolean Series, True where the value is blank
+    """
+    return (values == "") | values.str.isspace()
+
+
 def _clean_merchant_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and prepare merchant data.
@@ -145,13 +347,18 @@ def _clean_merchant_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     logger.debug("Cleaning merchant data")
 
-    # Make a copy to avoid modifying the original
-    cleaned_df = df.copy()
+    # Listing merchant IDs is costly on large frames, so only do it when the
+    # output will actually be emitted
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Shallow copy: columns are replaced below rather than written in place,
+    # so the original frame is left untouched without duplicating its data
+    cleaned_df = df.copy(deep=False)
 
     # Debug original data
-    logger.debug(f"Before cleaning: {len(cleaned_df)} rows")
-    if not cleaned_df.empty:
-        logger.debug(f"Original merchant_ids: {cleaned_df['merchant_id'].tolist()}")
+    logger.debug("Before cleaning: %d rows", len(cleaned_df))
+    if debug_enabled and not cleaned_df.empty:
+        logger.debug("Original merchant_ids: %s", cleaned_df["merchant_id"].tolist())
 
     # Fill missing values with empty strings for text columns
     text_columns = [
@@ -165,82 +372,103 @@ def _clean_merchant_data(df: pd.DataFrame) -> pd.DataFrame:
         "country",
     ]
 
-    for col in text_columns:
-        if col in cleaned_df.columns:
-            cleaned_df[col] = cleaned_df[col].fillna("").astype(str)
+    text_columns = [col for col in text_columns if col in cleaned_df.columns]
+    cleaned_df[text_columns] = (
+        cleaned_df[text_columns].astype(_STRING_DTYPE, copy=False).fillna("")
+    )
 
-    # Handle postcode specifically - keep as-is if NaN
+    # Handle postcode specifically - missing values become empty strings
     if "postcode" in cleaned_df.columns:
-        cleaned_df["postcode"] = cleaned_df["postcode"].astype(str)
+        cleaned_df["postcode"] = (
+            cleaned_df["postcode"].astype(_STRING_DTYPE, copy=False).fillna("")
+        )
         cleaned_df.loc[cleaned_df["postcode"] == "nan", "postcode"] = ""
 
     # Standardize merchant_id format
     if "merchant_id" in cleaned_df.columns:
         # Convert to string and strip whitespace
-        cleaned_df["merchant_id"] = cleaned_df["merchant_id"].astype(str).str.strip()
+        cleaned_df["merchant_id"] = (
+            cleaned_df["merchant_id"].astype(_STRING_DTYPE, copy=False).str.strip()
+        )
 
         # Debug merchant IDs after standardization
-        logger.debug(
-            f"Merchant IDs after standardization: {cleaned_df['merchant_id'].tolist()}"
-        )
+        if debug_enabled:
+            logger.debug(
+                "Merchant IDs after standardization: %s",
+                cleaned_df["merchant_id"].tolist(),
+            )
 
         # Check for empty merchant IDs - be more specific about what we consider empty
-        empty_condition = (
-            (cleaned_df["merchant_id"] == "")
-            | (cleaned_df["merchant_id"] == "nan")
-            | (cleaned_df["merchant_id"] == "None")
-            | (cleaned_df["merchant_id"].isna())
-        )
+        empty_condition = cleaned_df["merchant_id"].isin(_EMPTY_ID_TOKENS)
 
         if empty_condition.any():
             empty_count = empty_condition.sum()
-            logger.warning(f"Found {empty_count} records with empty merchant IDs")
+            logger.warning("Found %d records with empty merchant IDs", empty_count)
 
             # Debug which rows are being considered empty
-            empty_rows = cleaned_df[empty_condition]
-            logger.debug(
-                f"Rows being removed as empty: {empty_rows['merchant_id'].tolist()}"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Rows being removed as empty: %s",
+                    cleaned_df.loc[empty_condition, "merchant_id"].tolist(),
+                )
 
             # Remove rows with empty merchant IDs
             cleaned_df = cleaned_df[~empty_condition]
-            logger.debug(f"After removing empty IDs: {len(cleaned_df)} rows")
+            logger.debug("After removing empty IDs: %d rows", len(cleaned_df))
 
     # Debug before deduplication
-    if not cleaned_df.empty:
-        logger.debug(f"Merchant IDs before dedup: {cleaned_df['merchant_id'].tolist()}")
-        # Check for duplicates and log them
-        duplicates = cleaned_df["merchant_id"].duplicated(keep=False)
-        if duplicates.any():
-            duplicate_ids = cleaned_df.loc[duplicates, "merchant_id"].unique()
-            logger.debug(f"Duplicate merchant IDs found: {duplicate_ids}")
+    if debug_enabled and not cleaned_df.empty:
+        logger.debug(
+            "Merchant IDs before dedup: %s", cleaned_df["merchant_id"].tolist()
+        )
 
-    # Remove duplicate merchant_id entries (keep first occurrence)
-    pre_dedup_count = len(cleaned_df)
-    cleaned_df = cleaned_df.drop_duplicates(subset=["merchant_id"], keep="first")
-    post_dedup_count = len(cleaned_df)
+    # Flag repeated merchant_id entries in one hash pass (keep first occurrence);
+    # the same mask drives both the debug output and the removal
+    duplicates = cleaned_df["merchant_id"].duplicated(keep="first")
+    if duplicates.any():
+        if debug_enabled:
+            duplicate_ids = cleaned_df.loc[duplicates, "merchant_id"].unique()
+            logger.debug("Duplicate merchant IDs found: %s", duplicate_ids)
 
-    if pre_dedup_count != post_dedup_count:
-        logger.warning(
-            f"Removed {pre_dedup_count - post_dedup_count} duplicate merchant records"
-        )
+        # Remove duplicate merchant_id entries
+        cleaned_df = cleaned_df[~duplicates]
+        logger.warning("Removed %d duplicate merchant records", duplicates.sum())
 
     # Debug after deduplication
-    logger.debug(f"After deduplication: {len(cleaned_df)} rows")
-    if not cleaned_df.empty:
-        logger.debug(f"Final merchant IDs: {cleaned_df['merchant_id'].tolist()}")
+    logger.debug("After deduplication: %d rows", len(cleaned_df))
+    if debug_enabled and not cleaned_df.empty:
+        logger.debug("Final merchant IDs: %s", cleaned_df["merchant_id"].tolist())
 
     # Validate essential fields - but don't remove records, just warn
-    missing_name = cleaned_df["merchant_name"].str.strip() == ""
-    missing_address = cleaned_df["address_line1"].str.strip() == ""
+    missing_name = _is_blank(cleaned_df["merchant_name"])
+    missing_address = _is_blank(cleaned_df["address_line1"])
 
     if missing_name.any():
-        logger.warning(f"Found {missing_name.sum()} records with missing merchant name")
+        logger.warning(
+            "Found %d records with missing merchant name", missing_name.sum()
+        )
 
     if missing_address.any():
-        logger.warning(f"Found {missing_address.sum()} records with missing address")
+        logger.warning("Found %d records with missing address", missing_address.sum())
 
-    return cleaned_df
+    return cleaned_df.reset_index(drop=True)
+
+
+def index_merchants_by_id(merchants_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index merchant data by merchant_id for repeated lookups.
+
+    get_merchant_by_id uses hash lookups on the returned frame instead of
+    scanning the merchant_id column, which pays off when looking up many
+    merchants in the same frame.
+
+    Args:
+        merchants_df: DataFrame containing merchant data
+
+    Returns:
+        DataFrame indexed by merchant_id, without the merchant_id column
+    """
+    return merchants_df.set_index("merchant_id")
 
 
 def get_merchant_by_id(
@@ -256,19 +484,34 @@ def get_merchant_by_id(
     Returns:
         Dictionary with merchant data or None if not found
     """
-    merchant_rows = merchants_df[merchants_df["merchant_id"] == str(merchant_id)]
+    merchant_id = str(merchant_id)
+
+    id_indexed = merchants_df.index.name == "merchant_id"
+    if id_indexed:
+        # Frames from index_merchants_by_id are indexed by merchant_id
+        if merchant_id in merchants_df.index:
+            merchant_rows = merchants_df.loc[[merchant_id]]
+        else:
+            merchant_rows = merchants_df.iloc[:0]
+    else:
+        merchant_rows = merchants_df[merchants_df["merchant_id"] == merchant_id]
 
     if len(merchant_rows) == 0:
-        logger.warning(f"Merchant with ID {merchant_id} not found")
+        logger.warning("Merchant with ID %s not found", merchant_id)
         return None
 
     if len(merchant_rows) > 1:
         logger.warning(
-            f"Multiple entries found for merchant ID {merchant_id}, using first entry"
+            "Multiple entries found for merchant ID %s, using first entry",
+            merchant_id,
         )
 
-    # Convert the first row to a dictionary
-    merchant_dict = merchant_rows.iloc[0].to_dict()
+    # Convert the first row to a dictionary, reading each column directly
+    # rather than materializing the row as a mixed-type Series
+    merchant_dict = {"merchant_id": merchant_id} if id_indexed else {}
+    merchant_dict.update(
+        (column, merchant_rows[column].iat[0]) for column in merchant_rows.columns
+    )
 
     return merchant_dict
 
@@ -281,60 +524,119 @@ def filter_merchants(
 
     Args:
         merchants_df: DataFrame containing merchant data
-        filters: Dictionary of column:value pairs to filter by
+        filters: Dictionary of column:value pairs to filter by. A list, tuple
+            or set of values matches any of them.
         exact_match: Whether to require exact matches (False for partial matching)
 
     Returns:
         Filtered DataFrame
     """
-    filtered_df = merchants_df.copy()
+    # Combine all filters into one mask and index the frame once
+    mask = np.ones(len(merchants_df), dtype=bool)
 
     for column, value in filters.items():
-        if column not in filtered_df.columns:
-            logger.warning(f"Column '{column}' not found, skipping this filter")
+        if column not in merchants_df.columns:
+            logger.warning("Column '%s' not found, skipping this filter", column)
             continue
 
-        if exact_match:
-            filtered_df = filtered_df[filtered_df[column] == value]
-        else:
-            # For string columns, use case-insensitive contains
-            if filtered_df[column].dtype == "object":
-                filtered_df = filtered_df[
-                    filtered_df[column].str.contains(value, case=False, na=False)
-                ]
+        col = merchants_df[column]
+        column_dtype = col.dtype
+        any_of = isinstance(value, (list, tuple, set, frozenset))
+        if any_of and not value:
+            # No alternatives to match; an empty pattern would match every row
+            mask[:] = False
+            continue
+
+        if not exact_match and (
+            column_dtype == object or isinstance(column_dtype, pd.StringDtype)
+        ):
+            # For string columns, use case-insensitive substring matching
+            if any_of:
+                # Scan once for all alternatives instead of once per value
+                pattern = "|".join(re.escape(str(v)) for v in value)
+                matches = col.str.contains(pattern, case=False, na=False, regex=True)
             else:
-                filtered_df = filtered_df[filtered_df[column] == value]
+                matches = col.str.contains(value, case=False, na=False, regex=False)
+        elif any_of:
+            matches = col.isin(value)
+        else:
+            matches = col == value
+
+        mask &= matches.to_numpy(dtype=bool, na_value=False)
 
-    logger.info(f"Filtered merchant data: {len(filtered_df)} records match criteria")
+    filtered_df = merchants_df[mask]
+
+    logger.info("Filtered merchant data: %d records match criteria", len(filtered_df))
     return filtered_df
 
 
-def export_merchants_to_excel(merchants_df: pd.DataFrame, output_path: str) -> str:
+def export_merchants_to_excel(
+    merchants_df: pd.DataFrame, output_path: str, file_format: Optional[str] = None
+) -> str:
     """
     Export merchant data to Excel file.
 
+    Parquet and Feather are also supported, and are much faster and smaller
+    for output that is not opened by hand. Unless file_format is given, the
+    format follows the output file extension; .xlsm and .xls paths are
+    exported as Excel too.
+
     Args:
         merchants_df: DataFrame containing merchant data
-        output_path: Path for the output Excel file
+        output_path: Path for the output file
+        file_format: One of "xlsx", "parquet" or "feather", in any case
+            (None to infer)
 
     Returns:
-        Path to the created Excel file
+        Path to the created file
+
+    Raises:
+        ValueError: If the format is not supported
     """
+    excel_extension = output_path.lower().endswith(_OTHER_EXCEL_EXTENSIONS)
+    if file_format is None:
+        extension = os.path.splitext(output_path)[1].lstrip(".")
+        file_format = "xlsx" if excel_extension else extension
+    file_format = file_format.lower()
+    if file_format not in _EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{file_format}' for {output_path}, "
+            f"expected one of {', '.join(_EXPORT_FORMATS)}"
+        )
+
     try:
         # Create directory if it doesn't exist
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-
-        # Export to Excel
-        merchants_df.to_excel(output_path, index=False)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        if file_format == "parquet":
+            merchants_df.to_parquet(output_path, compression="zstd", index=False)
+        elif file_format == "feather":
+            # Feather only stores a default index
+            merchants_df.reset_index(drop=True).to_feather(
+                output_path, compression="lz4"
+            )
+        elif excel_extension:
+            merchants_df.to_excel(output_path, index=False)
+        else:
+            # Export to Excel (xlsxwriter is faster than openpyxl for write-only
+            # output). constant_memory is not used: pandas writes cells column
+            # by column, which that mode silently truncates.
+            with pd.ExcelWriter(
+                output_path,
+                engine="xlsxwriter",
+                datetime_format="yyyy-mm-dd hh:mm:ss",
+                engine_kwargs={"options": {"strings_to_urls": False}},
+            ) as writer:
+                merchants_df.to_excel(writer, index=False)
         logger.info(
-            f"Successfully exported {len(merchants_df)} merchants to {output_path}"
+            "Successfully exported %d merchants to %s", len(merchants_df), output_path
         )
 
         return output_path
 
     except Exception as e:
-        error_msg = f"Error exporting to Excel: {str(e)}"
+        error_msg = f"Error exporting to {_EXPORT_FORMATS[file_format]}: {str(e)}"
         logger.error(error_msg)
         raise RuntimeError(error_msg)
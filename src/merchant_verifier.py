@@ -8,72 +8,680 @@ This module provides the core functionality for verifying merchant address infor
 by searching for merchant websites and comparing address details.
 
 It uses browser automation to search for merchant websites and verify address information
-against provided merchant data from Excel files.
+against provided merchant data from Excel files. Candidate websites, and merchants in a
+batch, are checked concurrently through the Playwright async API.
 """
 
 # Standard library imports
 import os
 import re
 import time
-from typing import Dict, Optional, Any, List, Tuple
-from urllib.parse import urljoin
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Any, List, Tuple, Union
+from urllib.parse import urljoin, urlsplit
 
 # Third-party imports
-from playwright.sync_api import Page, sync_playwright
+import pandas as pd
+import requests
+from playwright.async_api import BrowserContext, Page, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 # Local imports
 from src.config.logging_config import get_logger
+from src.web_automation import get_http_session
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Patterns used by clean_text, compiled once
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WS_RE = re.compile(r"\s+")
+
+# Characters replaced when a merchant ID is used in a screenshot file name
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\-]")
+
+# Merchant fields compared against page text; preclean_merchants stores their
+# cleaned values in columns with this suffix
+_ADDRESS_FIELDS = ("address_line1", "town", "postcode", "country")
+_CLEAN_SUFFIX = "_clean"
+
+# RE2 form of clean_text's [^\w\s] for Arrow string kernels, whose \w and \s
+# are ASCII-only
+_ARROW_PUNCT_PATTERN = r"[^\p{L}\p{N}_\s]"
+
+# Domains matched against a URL's hostname, including any subdomain of them
+_SOCIAL_MEDIA_DOMAINS = frozenset(
+    {
+        "facebook.com",
+        "fb.com",
+        "instagram.com",
+        "twitter.com",
+        "linkedin.com",
+        "youtube.com",
+        "tiktok.com",
+        "pinterest.com",
+        "snapchat.com",
+        "reddit.com",
+        "tumblr.com",
+        "whatsapp.com",
+        "telegram.org",
+        "medium.com",
+    }
+)
+
+_DIRECTORY_DOMAINS = frozenset(
+    {
+        "yelp.com",
+        "tripadvisor.com",
+        "yellowpages.com",
+        "manta.com",
+        "bbb.org",
+        "thomasnet.com",
+        "angi.com",
+        "foursquare.com",
+        "mapquest.com",
+        "booking.com",
+        "expedia.com",
+        "hotels.com",
+        "glassdoor.com",
+        "indeed.com",
+        "amazon.com",
+        "ebay.com",
+    }
+)
+
+# Search engine and other sites never treated as merchant websites
+_EXCLUDED_DOMAINS = frozenset(
+    {
+        "bing.com",
+        "duckduckgo.com",
+        "youtube.com",
+        "wikipedia.org",
+        "microsoft.com",
+        "apple.com",
+    }
+)
+
+# Excluded whatever the country domain (google.fr, amazon.co.uk, ...)
+_EXCLUDED_BRANDS = frozenset({"google", "amazon", "pinterest"})
+
+
+def _hostname(url: str) -> str:
+    """Return the lowercased hostname of a URL, or an empty string."""
+    try:
+        return urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+
+
+def _host_in(hostname: str, domains: frozenset) -> bool:
+    """Check whether a hostname, or any parent domain of it, is in domains."""
+    parts = hostname.split(".")
+    return any(".".join(parts[i:]) in domains for i in range(len(parts) - 1))
+
+
+def _is_excluded_host(hostname: str) -> bool:
+    """Check whether a hostname belongs to a site never treated as a merchant's."""
+    return _host_in(hostname, _EXCLUDED_DOMAINS) or any(
+        label in _EXCLUDED_BRANDS for label in hostname.split(".")[:-1]
+    )
+
+
+# Keywords of search engine pages that block automated searches, by kind
+_BLOCKED_PAGE_KINDS = {
+    "recaptcha": "captcha",
+    "unusual traffic": "captcha",
+    "verify you're human": "captcha",
+    "privacy error": "captcha",
+    "before you continue": "interstitial",
+    "avant de continuer": "interstitial",
+    "consent choices": "interstitial",
+}
+_BLOCKED_PAGE_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in _BLOCKED_PAGE_KINDS), re.IGNORECASE
+)
+
+
+def _detect_blocked_page(text: str) -> Optional[str]:
+    """
+    Scan text once for CAPTCHA and consent-interstitial keywords.
+
+    Args:
+        text: Page title or HTML, in any case
+
+    Returns:
+        "captcha" if any CAPTCHA keyword appears, else "interstitial" if any
+        interstitial keyword appears, else None
+    """
+    kind = None
+    for match in _BLOCKED_PAGE_RE.finditer(text):
+        kind = _BLOCKED_PAGE_KINDS[match.group(0).lower()]
+        if kind == "captcha":
+            break
+    return kind
+
+
+# Raw result links taken from a search page; twice the 15 kept after filtering
+_MAX_RAW_LINKS = 30
+
+# Highest confidence a page can score without the postcode; a best result
+# below it can be beaten by pages the postcode pre-check skipped
+_NO_POSTCODE_MAX_CONFIDENCE = 60
+
+# Elements that usually hold a business address, tried in order
+_ADDRESS_SECTION_SELECTORS = [
+    "footer",
+    ".address",
+    ".contact",
+    ".location",
+    "#contact",
+    "#address",
+    "address",
+]
+
+# Scrolls to the first element whose text contains one of the terms
+# (case-insensitive), falling back to the first selector that matches
+_SCROLL_TO_ADDRESS_JS = """
+([terms, selectors]) => {
+    const wanted = terms.filter(Boolean).map(t => t.toLowerCase());
+    let target = null;
+    for (const term of wanted) {
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            if (walker.currentNode.nodeValue.toLowerCase().includes(term)) {
+                target = walker.currentNode.parentElement;
+                break;
+            }
+        }
+        if (target) break;
+    }
+    for (const sel of selectors) {
+        if (target) break;
+        target = document.querySelector(sel);
+    }
+    if (!target) return false;
+    target.scrollIntoView({block: "center"});
+    return true;
+}
+"""
+
+# Turn a merchant name into domain guesses: words joined, or joined with dashes
+_DOMAIN_JOINED_TABLE = str.maketrans("", "", " -'")
+_DOMAIN_DASHED_TABLE = str.maketrans(" ", "-", "'")
+
+# Chromium flags that cut memory and background work for headless scraping
+_CHROMIUM_ARGS = [
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter",
+    "--js-flags=--max-old-space-size=512",
+]
+
+# Resource types never needed to read a page's text
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Ad and analytics hosts (a small EasyList-style subset); subdomains are blocked too
+_TRACKER_HOSTS = frozenset(
+    {
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googlesyndication.com",
+        "googleadservices.com",
+        "doubleclick.net",
+        "facebook.net",
+        "bat.bing.com",
+        "clarity.ms",
+        "hotjar.com",
+        "scorecardresearch.com",
+        "quantserve.com",
+        "criteo.com",
+        "criteo.net",
+        "taboola.com",
+        "outbrain.com",
+        "adnxs.com",
+        "adsrvr.org",
+        "amazon-adsystem.com",
+        "pubmatic.com",
+        "rubiconproject.com",
+        "casalemedia.com",
+        "openx.net",
+        "moatads.com",
+        "segment.io",
+        "segment.com",
+        "optimizely.com",
+        "mixpanel.com",
+        "nr-data.net",
+    }
+)
+
+
+class _TTLCache:
+    """Small in-memory cache whose entries expire ttl seconds after being set."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the oldest entry when the cache is full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+
+@dataclass(slots=True, frozen=True)
+class NormalizedMerchant:
+    """
+    Cleaned address fields of one merchant, prepared once for matching.
+
+    Built by AsyncMerchantVerifier.normalize_merchant and reused for every
+    candidate page, so the merchant is not re-cleaned per page.
+    """
 
-class MerchantVerifier:
+    address: str
+    address_words: Tuple[str, ...]
+    town: str
+    postcode: str
+    country: str
+    partial_threshold: float  # address words needed for a partial match
+    nearby_threshold: float  # address words needed near the postcode or town
+
+
+class AsyncMerchantVerifier:
     """
     A class to automate merchant address verification using web search.
 
     This class handles the process of searching for merchant websites,
     navigating to relevant pages, and verifying address information.
+
+    Use it as an async context manager so the browser is always shut down:
+
+        async with AsyncMerchantVerifier() as verifier:
+            result = await verifier.find_and_verify_merchant(merchant_data)
     """
 
     def __init__(
-        self, headless: bool = True, screenshots_dir: str = "verification_screenshots"
+        self,
+        headless: bool = True,
+        screenshots_dir: str = "verification_screenshots",
+        max_concurrency: int = 5,
+        recycle_every: int = 50,
+        debug: bool = False,
+        cdp_endpoint: Optional[str] = None,
     ):
         """
         Initialize the merchant verification system.
 
+        The browser is not launched until start() is awaited, which entering
+        the async context manager does.
+
         Args:
             headless: Whether to run browser in headless mode (invisible)
             screenshots_dir: Directory to save verification screenshots
+            max_concurrency: Maximum number of pages open at the same time (page pool size)
+            recycle_every: Number of merchants after which the browser context is
+                replaced, to release memory it accumulates
+            debug: Whether to save screenshots of every step; otherwise only
+                errors and matched address sections are captured
+            cdp_endpoint: URL of an already running Chromium (started with
+                --remote-debugging-port) to attach to instead of launching one,
+                so several worker processes can share a single browser
         """
-        logger.info("Initializing MerchantVerifier")
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=headless)
-        self.context = self.browser.new_context(
-            viewport={"width": 1280, "height": 800},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4472.124 Safari/537.36",
-        )
+        logger.info("Initializing AsyncMerchantVerifier")
+        self.headless = headless
+        self.cdp_endpoint = cdp_endpoint
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        # Warm pages shared by all merchants; its size bounds concurrency
+        self._pool_size = max_concurrency
+        self._page_pool: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency)
+        # Pages currently borrowed from the pool
+        self._pages_out = 0
+        # Page releases still running after their borrower was cancelled
+        self._page_releases: set = set()
+
+        # Merchants verified since the context was last created
+        self._recycle_every = recycle_every
+        self._merchants_served = 0
+        self._recycle_lock = asyncio.Lock()
+
+        # Search results per query and site results per (url, merchant address),
+        # so repeated merchants skip the network
+        self._search_cache = _TTLCache()
+        self._site_cache = _TTLCache()
+        # Site checks under way, so concurrent merchants sharing a website and
+        # address wait for one visit instead of each navigating to it
+        self._site_checks_in_flight: Dict[Any, asyncio.Future] = {}
+
+        # Keep-alive HTTP session for probing guessed domains without a browser
+        self._probe_session = get_http_session()
+
+        self.debug = debug
 
         # Create screenshots directory if it doesn't exist
         os.makedirs(screenshots_dir, exist_ok=True)
         self.screenshots_dir = screenshots_dir
 
-    def __del__(self):
-        """Clean up resources upon object destruction."""
-        logger.info("Cleaning up MerchantVerifier resources")
-        try:
-            if hasattr(self, "browser") and self.browser:
+    async def start(self) -> "AsyncMerchantVerifier":
+        """
+        Launch (or attach to) the browser and create the shared browser context.
+
+        Returns:
+            The verifier itself, so it can be chained after construction
+        """
+        self.playwright = await async_playwright().start()
+        if self.cdp_endpoint:
+            logger.info(f"Attaching to running browser at {self.cdp_endpoint}")
+            self.browser = await self.playwright.chromium.connect_over_cdp(
+                self.cdp_endpoint
+            )
+        else:
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless, args=_CHROMIUM_ARGS
+            )
+        await self._open_context()
+        return self
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context set up for reading merchant pages."""
+        context = await self.browser.new_context(
+            viewport={"width": 1280, "height": 800},
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4472.124 Safari/537.36",
+            bypass_csp=True,
+            service_workers="block",
+        )
+        # Only page text is used, so skip downloading assets and trackers
+        await context.route("**/*", self._filter_request)
+        return context
+
+    async def _fill_pool(self) -> None:
+        """
+        Add new pages from the current context until every pool slot is filled.
+
+        Slots held by borrowed pages are left for those pages to come back to,
+        so slots whose page was lost are the ones refilled.
+        """
+        while self._page_pool.qsize() + self._pages_out < self._pool_size:
+            page = await self.context.new_page()
+            # A returned page may have filled the slot in the meantime
+            if self._page_pool.qsize() + self._pages_out < self._pool_size:
+                self._page_pool.put_nowait(page)
+            else:
+                await page.close()
+
+    async def _open_context(self) -> None:
+        """Create the shared browser context and fill the page pool from it."""
+        self.context = await self._new_context()
+        await self._fill_pool()
+
+    async def _merchant_done(self) -> None:
+        """
+        Count a verified merchant and recycle the context when due.
+
+        Recycling takes every page back from the pool first, so it waits for
+        borrowed pages to be returned while new work waits for the fresh pool.
+        If some pages are still borrowed when that wait times out, the new
+        context is swapped in before the old one is closed, and those pages
+        are replaced from the new context when they are returned. Every other
+        slot, including any whose page was lost, gets a new page.
+        """
+        async with self._recycle_lock:
+            self._merchants_served += 1
+            if self._merchants_served < self._recycle_every:
+                return
+            self._merchants_served = 0
+
+            logger.info(
+                f"Recycling browser context after {self._recycle_every} merchants"
+            )
+            while self._pages_out or not self._page_pool.empty():
                 try:
-                    self.browser.close()
-                except Exception as e:
-                    logger.debug(f"Browser already closed: {str(e)}")
-            if hasattr(self, "playwright") and self.playwright:
+                    await asyncio.wait_for(self._page_pool.get(), timeout=60)
+                except asyncio.TimeoutError:
+                    logger.warning("Timed out waiting for pooled pages to return")
+                    break
+
+            old_context = self.context
+            self.context = await self._new_context()
+            # Pages returned while the new context was being created belong to
+            # the old one
+            while not self._page_pool.empty():
+                self._page_pool.get_nowait()
+            try:
+                await old_context.close()
+            except Exception as e:
+                logger.debug(f"Error closing old context: {str(e)}")
+            await self._fill_pool()
+
+    async def aclose(self) -> None:
+        """
+        Close the browser context and browser, then stop Playwright.
+
+        A browser attached through cdp_endpoint is only disconnected from, so
+        it stays up for the other workers sharing it.
+        """
+        logger.info("Cleaning up AsyncMerchantVerifier resources")
+        await asyncio.gather(*self._page_releases, return_exceptions=True)
+        while not self._page_pool.empty():
+            self._page_pool.get_nowait()
+
+        if self.context:
+            try:
+                await self.context.close()
+            except Exception as e:
+                logger.debug(f"Context already closed: {str(e)}")
+            self.context = None
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                logger.debug(f"Browser already closed: {str(e)}")
+            self.browser = None
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception as e:
+                logger.debug(f"Playwright already stopped: {str(e)}")
+            self.playwright = None
+
+    async def __aenter__(self) -> "AsyncMerchantVerifier":
+        """Start the browser when entering an async with block."""
+        try:
+            return await self.start()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Shut the browser down when leaving an async with block."""
+        await self.aclose()
+
+    async def _filter_request(self, route: Route) -> None:
+        """
+        Abort requests for assets and trackers, let everything else through.
+
+        Args:
+            route: Intercepted Playwright route
+        """
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or _host_in(
+            _hostname(request.url), _TRACKER_HOSTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _acquire_page(self) -> Page:
+        """Take a page from the pool, waiting until one is free."""
+        page = await self._page_pool.get()
+        self._pages_out += 1
+        return page
+
+    async def _release_page(self, page: Page) -> None:
+        """
+        Return a page to the pool.
+
+        The page is navigated to about:blank so the previous document is
+        dropped. A page that can no longer be used, or that comes from a
+        context recycled while it was borrowed, is closed and its pool slot is
+        filled with a new page from the current context. If no new page can
+        be made, the slot stays empty until the next recycle refills it.
+        """
+        try:
+            if page.context is self.context:
                 try:
-                    self.playwright.stop()
+                    await page.goto("about:blank")
                 except Exception as e:
-                    logger.debug(f"Playwright already stopped: {str(e)}")
+                    logger.debug(f"Replacing unusable pooled page: {str(e)}")
+                else:
+                    # The context may have been recycled during the navigation
+                    if page.context is self.context:
+                        self._page_pool.put_nowait(page)
+                        return
+            try:
+                await page.close()
+            except Exception:
+                pass
+            if self.context is None:
+                return  # Shutting down
+            try:
+                self._page_pool.put_nowait(await self.context.new_page())
+            except Exception as e:
+                logger.warning(f"Could not replace pooled page: {str(e)}")
+        finally:
+            # Counted back right as the page (or its replacement) is pooled,
+            # with no await in between, so the pool never looks overfull
+            self._pages_out -= 1
+
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """Borrow a page from the pool for the duration of a with block."""
+        page = await self._acquire_page()
+        try:
+            yield page
+        finally:
+            # Shielded so that cancelling the borrower, as an early exit in
+            # find_and_verify_merchant does, cannot interrupt the release and
+            # lose the page; the set keeps the release alive meanwhile
+            release = asyncio.ensure_future(self._release_page(page))
+            self._page_releases.add(release)
+            release.add_done_callback(self._page_releases.discard)
+            await asyncio.shield(release)
+
+    async def _wait_for_idle(self, page: Page, timeout: int = 4000) -> None:
+        """
+        Wait until the page's network is idle, or give up after timeout ms.
+
+        Args:
+            page: Playwright page object
+            timeout: Maximum time to wait in milliseconds
+        """
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _wait_for_contact_details(self, page: Page, timeout: int = 3000) -> None:
+        """
+        Wait until address-bearing markup is in the DOM, or give up after timeout ms.
+
+        Contact pages usually render their address in one of these elements, so
+        this returns as soon as one is attached rather than waiting for the
+        network to go quiet.
+
+        Args:
+            page: Playwright page object
+            timeout: Maximum time to wait in milliseconds
+        """
+        try:
+            await page.wait_for_selector(
+                "address, footer, .address, .contact, #contact",
+                state="attached",
+                timeout=timeout,
+            )
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _screenshot(
+        self, page: Page, filename: str, always: bool = False, **kwargs: Any
+    ) -> Optional[str]:
+        """
+        Save a screenshot of the page in debug mode, or when always is set.
+
+        Args:
+            page: Playwright page object
+            filename: File name inside the screenshots directory
+            always: Capture even outside debug mode (errors and evidence)
+            **kwargs: Extra arguments for page.screenshot
+
+        Returns:
+            Path of the saved screenshot, or None if none was taken
+        """
+        if not (self.debug or always):
+            return None
+        screenshot_path = os.path.join(self.screenshots_dir, filename)
+        await page.screenshot(path=screenshot_path, **kwargs)
+        return screenshot_path
+
+    def _merchant_screenshot_name(
+        self, merchant_data: Dict[str, Any], filename: str
+    ) -> str:
+        """
+        Prefix a screenshot file name with the merchant it was taken for.
+
+        Merchants are verified concurrently, so names built from the site
+        number alone would overwrite each other's evidence.
+
+        Args:
+            merchant_data: Merchant information dictionary
+            filename: File name without the merchant prefix
+
+        Returns:
+            File name starting with the merchant ID (or name, if it has no ID)
+        """
+        merchant_key = str(
+            merchant_data.get("merchant_id") or merchant_data.get("merchant_name", "")
+        )
+        return f"{_FILENAME_UNSAFE_RE.sub('_', merchant_key)[:50]}_{filename}"
+
+    async def _page_text(self, page: Page) -> str:
+        """
+        Get the rendered text of the page body from the browser.
+
+        Args:
+            page: Playwright page object
+
+        Returns:
+            Visible body text, or an empty string if the page has no body
+        """
+        try:
+            return await page.inner_text("body", timeout=5000)
         except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}")
+            logger.debug(f"Could not read body text of {page.url}: {str(e)}")
+            return ""
 
     def clean_text(self, text: str) -> str:
         """
@@ -87,13 +695,54 @@ class MerchantVerifier:
         """
         if not text:
             return ""
-        # Convert to lowercase
-        text = str(text).lower()
-        # Remove punctuation
-        text = re.sub(r"[^\w\s]", " ", text)
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        # Lowercase, replace punctuation with spaces, then normalize whitespace
+        return _WS_RE.sub(" ", _PUNCT_RE.sub(" ", str(text).lower())).strip()
+
+    @staticmethod
+    def preclean_merchants(merchants_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Clean the address fields of a whole merchant table at once.
+
+        Adds an "<field>_clean" column per address field holding the same value
+        clean_text would produce, computed with vectorized Arrow string kernels.
+        check_address_match uses these columns instead of cleaning per call.
+
+        Args:
+            merchants_df: DataFrame of merchants, e.g. from extract_merchant_data
+
+        Returns:
+            Shallow copy of the DataFrame with the cleaned columns added
+        """
+        cleaned_df = merchants_df.copy(deep=False)
+        for field in _ADDRESS_FIELDS:
+            if field not in cleaned_df.columns:
+                continue
+            cleaned_df[f"{field}{_CLEAN_SUFFIX}"] = (
+                cleaned_df[field]
+                .astype("string[pyarrow]")
+                .fillna("")
+                .str.lower()
+                .str.replace(_ARROW_PUNCT_PATTERN, " ", regex=True)
+                .str.replace(r"\s+", " ", regex=True)
+                .str.strip()
+            )
+        return cleaned_df
+
+    def _clean_field(self, merchant_data: Dict[str, Any], field: str) -> str:
+        """
+        Get a cleaned merchant field, using the preclean_merchants value if present.
+
+        Args:
+            merchant_data: Merchant information dictionary
+            field: Name of the address field
+
+        Returns:
+            Cleaned field value
+        """
+        precleaned = merchant_data.get(f"{field}{_CLEAN_SUFFIX}")
+        if precleaned is not None:
+            return precleaned
+        return self.clean_text(str(merchant_data[field]))
 
     def is_social_media(self, url: str) -> bool:
         """
@@ -105,23 +754,7 @@ class MerchantVerifier:
         Returns:
             True if the URL is from a social media site
         """
-        social_media_domains = [
-            "facebook.com",
-            "fb.com",
-            "instagram.com",
-            "twitter.com",
-            "linkedin.com",
-            "youtube.com",
-            "tiktok.com",
-            "pinterest.com",
-            "snapchat.com",
-            "reddit.com",
-            "tumblr.com",
-            "whatsapp.com",
-            "telegram.org",
-            "medium.com",
-        ]
-        return any(domain in url.lower() for domain in social_media_domains)
+        return _host_in(_hostname(url), _SOCIAL_MEDIA_DOMAINS)
 
     def is_directory_site(self, url: str) -> bool:
         """
@@ -133,47 +766,63 @@ class MerchantVerifier:
         Returns:
             True if the URL is a directory or review site
         """
-        directory_domains = [
-            "yelp.com",
-            "tripadvisor.com",
-            "yellowpages.com",
-            "manta.com",
-            "bbb.org",
-            "thomasnet.com",
-            "angi.com",
-            "foursquare.com",
-            "mapquest.com",
-            "booking.com",
-            "expedia.com",
-            "hotels.com",
-            "glassdoor.com",
-            "indeed.com",
-            "amazon.com",
-            "ebay.com",
-        ]
-        return any(domain in url.lower() for domain in directory_domains)
+        return _host_in(_hostname(url), _DIRECTORY_DOMAINS)
+
+    def normalize_merchant(self, merchant_data: Dict[str, Any]) -> NormalizedMerchant:
+        """
+        Clean a merchant's address fields once for repeated matching.
+
+        Args:
+            merchant_data: Merchant information dictionary
+
+        Returns:
+            NormalizedMerchant for the merchant
+        """
+        address, town, postcode, country = (
+            self._clean_field(merchant_data, field) for field in _ADDRESS_FIELDS
+        )
+        address_words = tuple(address.split())
+        return NormalizedMerchant(
+            address=address,
+            address_words=address_words,
+            town=town,
+            postcode=postcode,
+            country=country,
+            partial_threshold=len(address_words) / 2,
+            nearby_threshold=len(address_words) / 3,
+        )
 
     def check_address_match(
-        self, page_content: str, merchant_data: Dict[str, Any]
+        self,
+        page_content: str,
+        merchant_data: Union[NormalizedMerchant, Dict[str, Any]],
+        precleaned: bool = False,
     ) -> Dict[str, Any]:
         """
         Check for address match with enhanced detection.
 
         Args:
-            page_content: HTML content of the page
-            merchant_data: Merchant information dictionary
+            page_content: Visible text of the page
+            merchant_data: Normalized merchant, or a merchant information dictionary
+            precleaned: Whether page_content has already been through clean_text
 
         Returns:
             Dictionary with match results
         """
         # Clean and prepare content
-        page_text = self.clean_text(page_content)
+        page_text = page_content if precleaned else self.clean_text(page_content)
 
         # Extract merchant address components
-        address_line = self.clean_text(str(merchant_data["address_line1"]))
-        town = self.clean_text(str(merchant_data["town"]))
-        postcode = self.clean_text(str(merchant_data["postcode"]))
-        country = self.clean_text(str(merchant_data["country"]))
+        merchant = (
+            merchant_data
+            if isinstance(merchant_data, NormalizedMerchant)
+            else self.normalize_merchant(merchant_data)
+        )
+        address_line = merchant.address
+        town = merchant.town
+        postcode = merchant.postcode
+        country = merchant.country
+        address_words = merchant.address_words
 
         logger.debug("Looking for address components:")
         logger.debug(f"  Address: '{address_line}'")
@@ -181,30 +830,33 @@ class MerchantVerifier:
         logger.debug(f"  Postcode: '{postcode}'")
         logger.debug(f"  Country: '{country}'")
 
+        # Locate postcode and town once; the positions are reused below
+        postcode_idx = page_text.find(postcode)
+        town_idx = page_text.find(town)
+
         # Simple check for exact matches
         has_address = address_line in page_text
-        has_town = town in page_text
-        has_postcode = postcode in page_text
+        has_town = town_idx != -1
+        has_postcode = postcode_idx != -1
         has_country = country in page_text
 
-        # Try alternative checks for address
-        address_words = address_line.split()
-        address_word_matches = sum(1 for word in address_words if word in page_text)
-        address_partial_match = address_word_matches > len(address_words) / 2
+        # Try alternative checks for address, matching whole words against
+        # the page's word set rather than scanning the page once per word
+        page_tokens = frozenset(page_text.split())
+        address_word_matches = sum(1 for word in address_words if word in page_tokens)
+        address_partial_match = address_word_matches > merchant.partial_threshold
 
         # Look for nearby address elements (within reasonable proximity)
         # Extract text chunks that might contain address information
         address_chunks = []
-        if postcode in page_text:
+        if has_postcode:
             # Look for text around the postcode
-            postcode_idx = page_text.find(postcode)
             start_idx = max(0, postcode_idx - 100)
             end_idx = min(len(page_text), postcode_idx + 100)
             address_chunks.append(page_text[start_idx:end_idx])
 
-        if town in page_text:
+        if has_town:
             # Look for text around the town
-            town_idx = page_text.find(town)
             start_idx = max(0, town_idx - 100)
             end_idx = min(len(page_text), town_idx + 100)
             address_chunks.append(page_text[start_idx:end_idx])
@@ -212,8 +864,11 @@ class MerchantVerifier:
         # Check if address words appear in these chunks
         nearby_address_match = False
         for chunk in address_chunks:
-            address_word_matches = sum(1 for word in address_words if word in chunk)
-            if address_word_matches > len(address_words) / 3:
+            chunk_tokens = frozenset(chunk.split())
+            chunk_word_matches = sum(
+                1 for word in address_words if word in chunk_tokens
+            )
+            if chunk_word_matches > merchant.nearby_threshold:
                 nearby_address_match = True
                 break
 
@@ -252,13 +907,11 @@ class MerchantVerifier:
         matching_text = None
         if has_postcode:
             # Extract text around postcode
-            postcode_idx = page_text.find(postcode)
             start_idx = max(0, postcode_idx - 50)
             end_idx = min(len(page_text), postcode_idx + 50)
             matching_text = page_text[start_idx:end_idx]
         elif has_town:
             # Extract text around town
-            town_idx = page_text.find(town)
             start_idx = max(0, town_idx - 50)
             end_idx = min(len(page_text), town_idx + 50)
             matching_text = page_text[start_idx:end_idx]
@@ -274,7 +927,7 @@ class MerchantVerifier:
             "matching_text": matching_text,
         }
 
-    def search_for_merchant(
+    async def search_for_merchant(
         self, query: str, page: Page
     ) -> Tuple[bool, List[Dict[str, str]]]:
         """
@@ -299,6 +952,7 @@ class MerchantVerifier:
                 "name": "Google",
                 "url_template": "https://www.google.com",
                 "search_input_selector": 'textarea[name="q"]',
+                "link_selector": "div#search a[href^='http']",
                 "is_direct_query_url": False,
                 "consent_selectors": [
                     "button#L2AGLb",
@@ -317,6 +971,7 @@ class MerchantVerifier:
                 "name": "Bing",
                 "url_template": "https://www.bing.com",
                 "search_input_selector": "input#sb_form_q",
+                "link_selector": "li.b_algo a[href^='http']",
                 "is_direct_query_url": False,
                 "consent_selectors": [
                     "button#bnp_btn_accept",
@@ -340,47 +995,49 @@ class MerchantVerifier:
 
                 if engine_config["is_direct_query_url"]:
                     current_url = engine_config["url_template"].format(query=query)
-                    page.goto(current_url, timeout=30000, wait_until="domcontentloaded")
-                    page.screenshot(
-                        path=os.path.join(
-                            self.screenshots_dir, f"{name}_initial_page.png"
-                        )
+                    await page.goto(
+                        current_url, timeout=30000, wait_until="domcontentloaded"
                     )
+                    await self._screenshot(page, f"{name}_initial_page.png")
                 else:
                     current_url = engine_config["url_template"]
-                    page.goto(current_url, timeout=30000, wait_until="domcontentloaded")
-                    page.screenshot(
-                        path=os.path.join(
-                            self.screenshots_dir, f"{name}_initial_page.png"
-                        )
+                    await page.goto(
+                        current_url, timeout=30000, wait_until="domcontentloaded"
                     )
+                    await self._screenshot(page, f"{name}_initial_page.png")
 
                     # CAPTCHA/Interstitial check for Google/Bing BEFORE consent/search
-                    page_title_lower = page.title().lower()
-                    page_content_lower = page.content().lower()
-                    captcha_keywords = [
-                        "recaptcha",
-                        "unusual traffic",
-                        "verify you're human",
-                        "privacy error",
-                    ]
-                    interstitial_keywords = [
-                        "before you continue",
-                        "avant de continuer",
-                        "consent choices",
-                    ]
-
-                    if any(kw in page_title_lower for kw in captcha_keywords) or any(
-                        kw in page_content_lower for kw in captcha_keywords
+                    # The title alone is enough to spot a CAPTCHA. Otherwise the
+                    # page HTML is only scanned when the title is empty or hints
+                    # at an interstitial, or the search box is missing (blocked
+                    # pages have none), so a clean page costs one element count
+                    page_title = await page.title()
+                    blocked_page_kind = _detect_blocked_page(page_title)
+                    if blocked_page_kind != "captcha" and (
+                        blocked_page_kind
+                        or not page_title
+                        or not await page.locator(
+                            engine_config["search_input_selector"]
+                        ).count()
                     ):
+                        blocked_page_kind = (
+                            _detect_blocked_page(await page.content())
+                            or blocked_page_kind
+                        )
+
+                    if blocked_page_kind == "captcha":
+                        await self._screenshot(
+                            page, f"{name}_initial_page.png", always=True
+                        )
                         logger.warning(
                             f"CAPTCHA detected on {name}. Screenshot: {name}_initial_page.png. Skipping."
                         )
                         continue  # Skip to next engine
 
-                    if name == "Google" and any(
-                        kw in page_content_lower for kw in interstitial_keywords
-                    ):
+                    if name == "Google" and blocked_page_kind == "interstitial":
+                        await self._screenshot(
+                            page, f"{name}_initial_page.png", always=True
+                        )
                         logger.warning(
                             f"Interstitial page detected on {name}. Screenshot: {name}_initial_page.png. Skipping."
                         )
@@ -391,38 +1048,60 @@ class MerchantVerifier:
                         logger.debug(
                             f"Waiting for potential consent dialogs on {name}..."
                         )
-                        page.wait_for_timeout(1000)  # Brief wait for dialogs to appear
+                        # Wait up to 1s for any known consent button at all; once
+                        # consent is given the shared context's cookies keep the
+                        # dialog away, so usually none of them need polling
+                        consent_selectors = engine_config["consent_selectors"]
+                        any_consent_button = page.locator(consent_selectors[0])
+                        for consent_sel in consent_selectors[1:]:
+                            any_consent_button = any_consent_button.or_(
+                                page.locator(consent_sel)
+                            )
+                        try:
+                            await any_consent_button.first.wait_for(
+                                state="attached", timeout=1000
+                            )
+                        except PlaywrightTimeoutError:
+                            consent_selectors = []
                         consent_clicked = False
-                        for sel_idx, consent_sel in enumerate(
-                            engine_config["consent_selectors"]
+                        # Count every selector in one concurrent round trip, then
+                        # click the most preferred button present; click() itself
+                        # waits for it to be visible and enabled
+                        consent_counts = await asyncio.gather(
+                            *(page.locator(sel).count() for sel in consent_selectors),
+                            return_exceptions=True,
+                        )
+                        for consent_sel, consent_count in zip(
+                            consent_selectors, consent_counts
                         ):
+                            if (
+                                isinstance(consent_count, Exception)
+                                or not consent_count
+                            ):
+                                continue
                             try:
-                                consent_button_locator = page.locator(consent_sel)
-                                if consent_button_locator.count() > 0:
-                                    first_button = consent_button_locator.first
-                                    first_button.wait_for(state="visible", timeout=3000)
-                                    first_button.wait_for(state="enabled", timeout=3000)
-                                    logger.debug(
-                                        f"Found {name} consent button with selector: {consent_sel}"
-                                    )
-                                    first_button.click(timeout=5000)
-                                    logger.debug(f"Clicked {name} consent button.")
-                                    page.wait_for_timeout(2000)
-                                    consent_clicked = True
-                                    break
+                                logger.debug(
+                                    f"Found {name} consent button with selector: {consent_sel}"
+                                )
+                                await page.locator(consent_sel).first.click(
+                                    timeout=5000
+                                )
+                                logger.debug(f"Clicked {name} consent button.")
+                                await page.wait_for_timeout(2000)
+                                consent_clicked = True
+                                break
                             except Exception as e_consent:
                                 logger.debug(
-                                    f"Attempt {sel_idx + 1} to click {name} consent button ({consent_sel}) failed: {str(e_consent)}"
+                                    f"Clicking {name} consent button ({consent_sel}) failed: {str(e_consent)}"
                                 )
-                        if not consent_clicked:
+                        if not consent_selectors:
+                            logger.debug(f"No {name} consent dialog shown.")
+                        elif not consent_clicked:
                             logger.debug(
                                 f"Could not click any known {name} consent buttons. Proceeding cautiously."
                             )
-                        page.screenshot(
-                            path=os.path.join(
-                                self.screenshots_dir,
-                                f"{name}_after_consent_attempt.png",
-                            )
+                        await self._screenshot(
+                            page, f"{name}_after_consent_attempt.png"
                         )
 
                     # Perform search for Google/Bing
@@ -430,39 +1109,39 @@ class MerchantVerifier:
                     search_box_locator = page.locator(
                         engine_config["search_input_selector"]
                     )
-                    search_box_locator.wait_for(state="visible", timeout=10000)
+                    await search_box_locator.wait_for(state="visible", timeout=10000)
                     logger.debug(f"{name} search box found. Entering search query...")
-                    search_box_locator.fill(query)
+                    await search_box_locator.fill(query)
                     logger.debug(f"Query entered for {name}. Submitting search...")
-                    search_box_locator.press("Enter")
+                    await search_box_locator.press("Enter")
                     logger.debug(f"{name} search submitted. Waiting for results...")
                     try:
-                        page.wait_for_load_state("domcontentloaded", timeout=10000)
+                        await page.wait_for_selector(
+                            engine_config["link_selector"], timeout=8000
+                        )
                     except Exception as e_load:
                         logger.warning(
-                            f"Problem waiting for load state after {name} search: {e_load}"
+                            f"Problem waiting for results after {name} search: {e_load}"
                         )
-                    time.sleep(3)  # Allow JS to render
 
-                page.screenshot(
-                    path=os.path.join(self.screenshots_dir, f"{name}_results_page.png")
-                )
+                await self._screenshot(page, f"{name}_results_page.png")
 
-                # Extract Links
+                # Extract Links, stopping in the browser once enough are found
                 extracted_links = []
                 if name == "DuckDuckGo_HTML":
-                    extracted_links = page.locator(
+                    extracted_links = await page.locator(
                         engine_config["link_selector"]
                     ).evaluate_all(
                         """
-                        links => links.map(link => ({
+                        (links, limit) => links.slice(0, limit).map(link => ({
                             url: link.href,
                             text: link.textContent ? link.textContent.trim() : ""
                         }))
-                        """
+                        """,
+                        _MAX_RAW_LINKS,
                     )
                 else:  # Google, Bing
-                    # A more general selector for result links
+                    # Result link selectors, most specific first
                     google_bing_link_selectors = [
                         "div#search a[href^='http']:not([href*='google.com']):not([href*='bing.com'])",
                         "li.b_algo a[href^='http']",
@@ -470,34 +1149,44 @@ class MerchantVerifier:
                         "a[h*='ID=SERP']",
                         "a[href^='http']",  # Fallback, very broad
                     ]
-                    for sel in google_bing_link_selectors:
-                        try:
-                            temp_links = page.locator(sel).evaluate_all(
-                                """
-                                links => links.filter(link => link.href && !link.href.startsWith('javascript:') && link.offsetParent !== null)
-                                            .map(link => ({
-                                                url: link.href,
-                                                text: link.innerText ? link.innerText.trim() : (link.textContent ? link.textContent.trim() : "")
-                                            }))
-                                """
-                            )
-                            if temp_links:
-                                extracted_links.extend(temp_links)
-                                # Break if we got a good number of links from a specific selector
-                                if len(extracted_links) > 10:
-                                    break
-                        except Exception as e_link_extract:
-                            logger.debug(
-                                f"Error extracting links with selector '{sel}' on {name}: {e_link_extract}"
-                            )
-                    # Deduplicate links based on URL
-                    seen_urls = set()
-                    unique_links = []
-                    for link_item in extracted_links:
-                        if link_item["url"] not in seen_urls:
-                            unique_links.append(link_item)
-                            seen_urls.add(link_item["url"])
-                    extracted_links = unique_links
+                    # One round trip: try the selectors in order, deduplicate by
+                    # URL, and move on to broader selectors only while fewer
+                    # than 11 links have been found
+                    extracted_links = await page.evaluate(
+                        """
+                        ([selectors, limit]) => {
+                            const seen = new Set();
+                            const links = [];
+                            for (const sel of selectors) {
+                                let candidates;
+                                try {
+                                    candidates = document.querySelectorAll(sel);
+                                } catch (e) {
+                                    continue;
+                                }
+                                for (const link of candidates) {
+                                    if (!link.href || link.href.startsWith('javascript:')
+                                        || link.offsetParent === null || seen.has(link.href)) {
+                                        continue;
+                                    }
+                                    seen.add(link.href);
+                                    links.push({
+                                        url: link.href,
+                                        text: link.innerText ? link.innerText.trim() : (link.textContent ? link.textContent.trim() : "")
+                                    });
+                                    if (links.length >= limit) {
+                                        return links;
+                                    }
+                                }
+                                if (links.length > 10) {
+                                    break;
+                                }
+                            }
+                            return links;
+                        }
+                        """,
+                        [google_bing_link_selectors, _MAX_RAW_LINKS],
+                    )
 
                 if not extracted_links:
                     logger.warning(f"No links extracted from {name}.")
@@ -507,63 +1196,26 @@ class MerchantVerifier:
                     f"Extracted {len(extracted_links)} raw links from {name}. Filtering..."
                 )
 
-                # Filter out search engine domains and excluded sites
-                excluded_domains_common = [
-                    "google.",
-                    "bing.com",
-                    "duckduckgo.com",
-                    "youtube.com",
-                    "wikipedia.org",
-                    "amazon.",
-                    "pinterest.",
-                    "microsoft.com",
-                    "apple.com",
-                    "support.google.com",
-                    "maps.google.com",
-                    "translate.google.com",
-                    "books.google.com",
-                    "policies.google.com",
-                    "play.google.com",
-                    "news.google.com",
-                    "accounts.google.com",
-                ]
-
-                temp_filtered_links = []
-                for link_data in extracted_links:
-                    link_url = link_data.get("url")
-                    if not link_url:
-                        continue
-                    try:
-                        # Basic check to avoid malformed URLs
-                        if not isinstance(link_url, str) or not link_url.startswith(
-                            ("http://", "https://")
-                        ):
-                            continue
-                        if not any(
-                            ex_domain in link_url.lower()
-                            for ex_domain in excluded_domains_common
-                        ):
-                            temp_filtered_links.append(link_data)
-                    except TypeError:
-                        logger.debug(f"Skipping malformed link data: {link_data}")
-                        continue
-
-                extracted_links = temp_filtered_links
-
-                # Filter for business vs directory sites
+                # Drop malformed, excluded and social media links, and split
+                # the rest into business and directory sites, parsing each
+                # link's hostname once
                 business_links = []
                 directory_links_buffer = []
 
                 for link_data in extracted_links:
-                    link_url = link_data["url"]
-                    if not self.is_social_media(
-                        link_url
-                    ) and not self.is_directory_site(link_url):
-                        business_links.append(link_data)
-                    elif not self.is_social_media(link_url) and self.is_directory_site(
-                        link_url
+                    link_url = link_data.get("url")
+                    # Basic check to avoid malformed URLs
+                    if not isinstance(link_url, str) or not link_url.startswith(
+                        ("http://", "https://")
                     ):
+                        continue
+                    host = _hostname(link_url)
+                    if _is_excluded_host(host) or _host_in(host, _SOCIAL_MEDIA_DOMAINS):
+                        continue
+                    if _host_in(host, _DIRECTORY_DOMAINS):
                         directory_links_buffer.append(link_data)
+                    else:
+                        business_links.append(link_data)
 
                 # Prioritize business links, then add directory links if needed
                 final_filtered_links = business_links
@@ -586,16 +1238,50 @@ class MerchantVerifier:
             except Exception as e:
                 logger.error(f"Error with {name} search: {type(e).__name__} - {str(e)}")
                 try:
-                    page.screenshot(
-                        path=os.path.join(self.screenshots_dir, f"{name}_error.png")
-                    )
+                    await self._screenshot(page, f"{name}_error.png", always=True)
                 except Exception:
                     pass
                 continue  # Try next search engine
 
         return success, search_results
 
-    def try_direct_url_guessing(
+    def _probe_domain(self, domain: str) -> bool:
+        """
+        Check with a HEAD request whether a domain serves a website.
+
+        Args:
+            domain: Host name to probe over HTTPS
+
+        Returns:
+            True if the host answered with a usable status code
+        """
+        try:
+            response = self._probe_session.head(
+                f"https://{domain}", timeout=3, allow_redirects=True
+            )
+        except requests.RequestException:
+            return False
+        # Some servers reject HEAD but still serve the page
+        return response.status_code < 400 or response.status_code == 405
+
+    async def _pick_live_domains(self, candidates: List[str]) -> List[str]:
+        """
+        Probe candidate domains concurrently and keep the ones that respond.
+
+        Args:
+            candidates: Domain names in order of preference
+
+        Returns:
+            Responding domains, in the same order as candidates
+        """
+        live = await asyncio.gather(
+            *(asyncio.to_thread(self._probe_domain, domain) for domain in candidates)
+        )
+        live_domains = [domain for domain, ok in zip(candidates, live) if ok]
+        logger.debug(f"Live guessed domains: {live_domains}")
+        return live_domains
+
+    async def try_direct_url_guessing(
         self, merchant_data: Dict[str, Any], page: Page
     ) -> Tuple[bool, Optional[Dict[str, str]]]:
         """
@@ -609,30 +1295,17 @@ class MerchantVerifier:
             Tuple of (success, result dictionary or None)
         """
         logger.info("Trying direct URL guessing...")
-        merchant_name_clean = (
-            merchant_data["merchant_name"]
-            .lower()
-            .replace(" ", "")
-            .replace("-", "")
-            .replace("'", "")
-        )
+        merchant_name = merchant_data["merchant_name"].lower()
+        merchant_name_clean = merchant_name.translate(_DOMAIN_JOINED_TABLE)
+        merchant_name_dashed = merchant_name.translate(_DOMAIN_DASHED_TABLE)
         possible_domains = [
-            f"www.{merchant_name_clean}.com",
-            f"www.{merchant_name_clean}.fr",
-            f"{merchant_name_clean}.com",
-            f"{merchant_name_clean}.fr",
+            f"{prefix}{name}.{tld}"
+            for name in (merchant_name_clean, merchant_name_dashed)
+            for prefix in ("www.", "")
+            for tld in ("com", "fr")
         ]
-        merchant_name_dashed = (
-            merchant_data["merchant_name"].lower().replace(" ", "-").replace("'", "")
-        )
-        possible_domains.extend(
-            [
-                f"www.{merchant_name_dashed}.com",
-                f"www.{merchant_name_dashed}.fr",
-                f"{merchant_name_dashed}.com",
-                f"{merchant_name_dashed}.fr",
-            ]
-        )
+        # Only hosts that answer an HTTP probe are worth a browser navigation
+        possible_domains = await self._pick_live_domains(possible_domains)
 
         success = False
         result = None
@@ -640,27 +1313,25 @@ class MerchantVerifier:
         for domain_attempt in possible_domains:
             try:
                 logger.info(f"Trying direct URL: https://{domain_attempt}")
-                page.goto(
+                await page.goto(
                     f"https://{domain_attempt}",
                     timeout=10000,
                     wait_until="domcontentloaded",
                 )
-                time.sleep(2)
-                screenshot_path = os.path.join(
-                    self.screenshots_dir,
-                    f"direct_{domain_attempt.replace('/', '_')}.png",
+                await self._wait_for_idle(page)
+                await self._screenshot(
+                    page, f"direct_{domain_attempt.replace('/', '_')}.png"
                 )
-                page.screenshot(path=screenshot_path)
 
                 if (
                     page.url != "about:blank"
-                    and "404" not in page.title().lower()
-                    and "not found" not in page.content().lower()
+                    and "404" not in (await page.title()).lower()
+                    and "not found" not in (await self._page_text(page)).lower()
                 ):
                     logger.info(f"Successfully loaded direct URL: {page.url}")
                     result = {
                         "url": page.url,
-                        "text": page.title() or "Directly Accessed Page",
+                        "text": (await page.title()) or "Directly Accessed Page",
                     }
                     success = True
                     break
@@ -672,250 +1343,501 @@ class MerchantVerifier:
 
         return success, result
 
-    def find_and_verify_merchant(
-        self, merchant_data: Dict[str, Any], max_websites: int = 5
+    def _quick_postcode_hit(self, page_text: str, merchant: NormalizedMerchant) -> bool:
+        """
+        Cheap pre-check for whether the merchant's postcode appears in page text.
+
+        Args:
+            page_text: Visible text of the page, already through clean_text
+            merchant: Normalized merchant
+
+        Returns:
+            True if the postcode appears in the text (always True for an empty postcode)
+        """
+        return merchant.postcode in page_text
+
+    def _build_verification_result(
+        self,
+        match_results: Dict[str, Any],
+        url: str,
+        title: str,
+        screenshot_path: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Build the verification result for one page from its address match.
+
+        Args:
+            match_results: Output of check_address_match
+            url: Canonical URL of the page
+            title: Page title
+            screenshot_path: Path of the page screenshot, if one was taken
+
+        Returns:
+            Verification result dictionary
+        """
+        return {
+            "url": url,
+            "title": title,
+            "address_found": match_results["has_address"]
+            or match_results["has_town"]
+            or match_results["has_postcode"],
+            "address_match": match_results["matching_text"],
+            "address_match_confidence": match_results["confidence"],
+            "screenshot_path": screenshot_path,
+            "verified": match_results["confidence"] > 50,  # Threshold for verification
+        }
+
+    def _score_unscored_pages(
+        self,
+        unscored_pages: List[Tuple[str, str, str, Optional[str], bool]],
+        merchant: NormalizedMerchant,
+        best_result: Optional[Dict[str, Any]],
     ) -> Optional[Dict[str, Any]]:
         """
-        Find merchant website and verify address information.
+        Fully score pages skipped by the postcode pre-check.
+
+        Args:
+            unscored_pages: (cleaned_text, url, title, screenshot_path,
+                is_contact_page) tuples from _visit_site
+            merchant: Normalized merchant
+            best_result: Best verification result so far, if any
+
+        Returns:
+            The better of best_result and the best of the scored pages
+        """
+        for text, url, title, screenshot_path, is_contact in unscored_pages:
+            result = self._build_verification_result(
+                self.check_address_match(text, merchant, precleaned=True),
+                url,
+                title,
+                screenshot_path,
+            )
+            if is_contact:
+                result["is_contact_page"] = True
+            if (
+                best_result is None
+                or result["address_match_confidence"]
+                > best_result["address_match_confidence"]
+            ):
+                best_result = result
+        return best_result
+
+    async def _cached_search(
+        self, query: str, page: Page
+    ) -> Tuple[bool, List[Dict[str, str]]]:
+        """
+        Run search_for_merchant, reusing recent successful results for the same query.
+
+        Args:
+            query: Search query string
+            page: Playwright page object
+
+        Returns:
+            Tuple of (success, search results)
+        """
+        query_key = self.clean_text(query)
+        cached_results = self._search_cache.get(query_key)
+        if cached_results is not None:
+            logger.info(f"Using cached search results for '{query}'")
+            return True, list(cached_results)
+
+        search_success, search_results = await self.search_for_merchant(query, page)
+        if search_success and search_results:
+            self._search_cache.set(query_key, list(search_results))
+        return search_success, search_results
+
+    async def _check_site(
+        self,
+        url: str,
+        site_number: int,
+        merchant_data: Dict[str, Any],
+        merchant: NormalizedMerchant,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Check one candidate website, reusing a recent result for the same merchant.
+
+        If the same website is already being checked for the same merchant,
+        that check's result is awaited and shared rather than visiting twice.
+        Results are kept per merchant, not just per address, because their
+        screenshot paths are named after the merchant they were taken for.
 
         Args:
+            url: Candidate website URL
+            site_number: 1-based position of the site, used in screenshot names
             merchant_data: Dictionary containing merchant information
-            max_websites: Maximum number of websites to check
+            merchant: The same merchant, normalized for matching
 
         Returns:
-            Dictionary with verification results or None if verification failed
+            Verification result dictionary, or None if the site could not be checked
         """
-        logger.info(
-            f"Starting verification for merchant: {merchant_data['merchant_name']}"
+        cache_key = (
+            url,
+            merchant_data.get("merchant_id") or merchant_data.get("merchant_name"),
+            (merchant.address, merchant.town, merchant.postcode, merchant.country),
         )
+        while True:
+            cached_result = self._site_cache.get(cache_key)
+            if cached_result is not None:
+                logger.info(f"Using cached result for website {url}")
+                return dict(cached_result)
+
+            in_flight = self._site_checks_in_flight.get(cache_key)
+            if in_flight is None:
+                break
+            logger.info(f"Waiting for the check already running on website {url}")
+            try:
+                result = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # The other check was cancelled; run this one instead
+                continue
+            return dict(result) if result is not None else None
 
-        # Prepare search query including name, location, and "site" to prioritize official sites
-        search_query = f"{merchant_data['merchant_name']} {merchant_data['town']} {merchant_data['country']} site"
-
+        in_flight = asyncio.get_running_loop().create_future()
+        self._site_checks_in_flight[cache_key] = in_flight
         try:
-            # Create a new page for search
-            page = self.context.new_page()
+            result = await self._visit_site(url, site_number, merchant_data, merchant)
+            if result is not None:
+                self._site_cache.set(cache_key, dict(result))
+            in_flight.set_result(result)
+            return result
+        finally:
+            del self._site_checks_in_flight[cache_key]
+            if not in_flight.done():
+                in_flight.cancel()
 
-            # Step 1: Search for the merchant
-            search_success, search_results = self.search_for_merchant(
-                search_query, page
-            )
+    async def _capture_address_section(
+        self, page: Page, site_number: int, merchant_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Scroll to the merchant's address on the page and screenshot it.
 
-            # Step 2: If search failed, try direct URL guessing
-            if not search_success or not search_results:
-                direct_success, direct_result = self.try_direct_url_guessing(
-                    merchant_data, page
-                )
-                if direct_success and direct_result:
-                    search_success = True
-                    search_results = [direct_result]
+        Args:
+            page: Playwright page showing the matched website
+            site_number: 1-based position of the site, used in the screenshot name
+            merchant_data: Dictionary containing merchant information
 
-            # Step 3: Process search results
-            verification_results = []
+        Returns:
+            Path of the address section screenshot, or None if none was taken
+        """
+        try:
+            # One round trip: scroll to the first element showing the
+            # postcode or town, else to a likely address block
+            found = await page.evaluate(
+                _SCROLL_TO_ADDRESS_JS,
+                [
+                    [
+                        str(merchant_data["postcode"]).strip(),
+                        str(merchant_data["town"]).strip(),
+                    ],
+                    _ADDRESS_SECTION_SELECTORS,
+                ],
+            )
+            if found:
+                return await self._screenshot(
+                    page,
+                    self._merchant_screenshot_name(
+                        merchant_data, f"website_{site_number}_address_section.png"
+                    ),
+                    always=True,
+                )
+        except Exception as e_addr_ss:
+            logger.warning(
+                f"Error capturing address section screenshot: {str(e_addr_ss)}"
+            )
+        return None
+
+    async def _visit_site(
+        self,
+        url: str,
+        site_number: int,
+        merchant_data: Dict[str, Any],
+        merchant: NormalizedMerchant,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Visit one candidate website on its own page and score its address match.
 
-            if search_success and search_results:
-                logger.info(f"Found {len(search_results)} potential websites to check.")
-                websites_checked = 0
+        Pages on which the merchant's postcode appears are scored first; the
+        others are only scored if those score too low to rule them out. If
+        neither the site nor its contact page shows the postcode, the pages
+        are returned unscored under "unscored_pages" as (cleaned_text, url,
+        title, screenshot_path, is_contact_page) tuples, for
+        find_and_verify_merchant to fall back on.
 
-                for result in search_results:
-                    url = result["url"]
+        Args:
+            url: Candidate website URL
+            site_number: 1-based position of the site, used in screenshot names
+            merchant_data: Dictionary containing merchant information
+            merchant: The same merchant, normalized for matching
 
-                    # Skip social media sites
-                    if self.is_social_media(url):
-                        logger.debug(f"Skipping social media site: {url}")
-                        continue
+        Returns:
+            Verification result dictionary, or None if the site could not be checked
+        """
+        async with self._pooled_page() as page:
+            try:
+                logger.info(f"Checking website {site_number}: {url}")
 
-                    websites_checked += 1
-                    logger.info(
-                        f"Checking website {websites_checked}/{max_websites}: {url}"
+                # Navigate to website
+                try:
+                    await page.goto(url, timeout=20000, wait_until="domcontentloaded")
+                    await self._wait_for_idle(page)  # Allow page to settle
+                except Exception as e_nav:
+                    logger.error(f"Error navigating to {url}: {str(e_nav)}")
+                    await self._screenshot(
+                        page,
+                        self._merchant_screenshot_name(
+                            merchant_data, f"website_{site_number}_nav_error.png"
+                        ),
+                        always=True,
                     )
+                    return None
+
+                page_title = await page.title()
+                screenshot_path = await self._screenshot(
+                    page,
+                    self._merchant_screenshot_name(
+                        merchant_data,
+                        f"website_{site_number}_{page_title[:20].replace(' ', '_')}.png",
+                    ),
+                    full_page=False,
+                )
 
-                    if websites_checked > max_websites:
-                        logger.info(
-                            f"Reached maximum number of websites to check ({max_websites})"
-                        )
-                        break
+                # Extract page content AFTER navigation and settling
+                # Clean once; the pre-check and the full match share the text
+                page_text = self.clean_text(await self._page_text(page))
+                verification_result = None
+                unscored_pages = []
 
-                    try:
-                        # Navigate to website
-                        try:
-                            page.goto(url, timeout=20000, wait_until="domcontentloaded")
-                            time.sleep(3)  # Allow page to settle
-                        except Exception as e_nav:
-                            logger.error(f"Error navigating to {url}: {str(e_nav)}")
-                            page.screenshot(
-                                path=os.path.join(
-                                    self.screenshots_dir,
-                                    f"website_{websites_checked}_nav_error.png",
-                                )
-                            )
-                            continue
+                if self._quick_postcode_hit(page_text, merchant):
+                    match_results = self.check_address_match(
+                        page_text, merchant, precleaned=True
+                    )
+                    verification_result = self._build_verification_result(
+                        match_results, page.url, page_title, screenshot_path
+                    )
 
-                        screenshot_path = os.path.join(
-                            self.screenshots_dir,
-                            f"website_{websites_checked}_{page.title()[:20].replace(' ', '_')}.png",
+                    # If high confidence match, capture address section and stop here
+                    if match_results["confidence"] > 70:
+                        logger.info(f"Found high confidence match on {url}.")
+                        address_screenshot_path = await self._capture_address_section(
+                            page, site_number, merchant_data
                         )
-                        page.screenshot(path=screenshot_path, full_page=False)
+                        if address_screenshot_path:
+                            verification_result[
+                                "address_screenshot_path"
+                            ] = address_screenshot_path
+                        return verification_result
+                else:
+                    unscored_pages.append(
+                        (page_text, page.url, page_title, screenshot_path, False)
+                    )
 
-                        # Extract page content AFTER navigation and settling
-                        page_content = page.content()
-                        match_results = self.check_address_match(
-                            page_content, merchant_data
+                # Try to check contact page
+                try:
+                    contact_page_links = page.locator(
+                        "a:text-matches('contact|nous trouver|find us|location', 'i')"
+                    )
+                    if await contact_page_links.count() > 0:
+                        contact_url_relative = (
+                            await contact_page_links.first.get_attribute("href")
                         )
+                        if contact_url_relative:
+                            contact_url_absolute = urljoin(
+                                page.url, contact_url_relative
+                            )
+                            logger.info(
+                                f"Found potential contact page: {contact_url_absolute}"
+                            )
 
-                        current_verification_result = {
-                            "url": page.url,  # Use page.url for canonical URL
-                            "title": page.title(),
-                            "address_found": match_results["has_address"]
-                            or match_results["has_town"]
-                            or match_results["has_postcode"],
-                            "address_match": match_results["matching_text"],
-                            "address_match_confidence": match_results["confidence"],
-                            "screenshot_path": screenshot_path,
-                            "verified": match_results["confidence"]
-                            > 50,  # Threshold for verification
-                        }
-                        verification_results.append(current_verification_result)
+                            await page.goto(
+                                contact_url_absolute,
+                                timeout=15000,
+                                wait_until="domcontentloaded",
+                            )
+                            await self._wait_for_contact_details(page)
+                            contact_screenshot_path = await self._screenshot(
+                                page,
+                                self._merchant_screenshot_name(
+                                    merchant_data, f"contact_page_{site_number}.png"
+                                ),
+                            )
 
-                        # If high confidence match, capture address section and stop search
-                        if match_results["confidence"] > 70:
-                            logger.info("Found high confidence match, stopping search.")
-                            try:
-                                selectors = [
-                                    f"*:text-matches('{merchant_data['postcode']}')",
-                                    f"*:text-matches('{merchant_data['town']}')",
-                                    "footer",
-                                    ".address",
-                                    ".contact",
-                                    ".location",
-                                    "#contact",
-                                    "#address",
-                                    "address",
-                                ]
-                                for selector in selectors:
-                                    try:
-                                        if page.locator(selector).count() > 0:
-                                            page.locator(
-                                                selector
-                                            ).first.scroll_into_view_if_needed()
-                                            address_screenshot_path = os.path.join(
-                                                self.screenshots_dir,
-                                                f"website_{websites_checked}_address_section.png",
-                                            )
-                                            page.screenshot(
-                                                path=address_screenshot_path
-                                            )
-                                            current_verification_result[
-                                                "address_screenshot_path"
-                                            ] = address_screenshot_path
-                                            break
-                                    except Exception:
-                                        continue
-                            except Exception as e_addr_ss:
-                                logger.warning(
-                                    f"Error capturing address section screenshot: {str(e_addr_ss)}"
+                            contact_text = self.clean_text(await self._page_text(page))
+                            contact_title = await page.title()
+                            if not self._quick_postcode_hit(contact_text, merchant):
+                                unscored_pages.append(
+                                    (
+                                        contact_text,
+                                        page.url,
+                                        contact_title,
+                                        contact_screenshot_path,
+                                        True,
+                                    )
                                 )
-                            break  # Break from website checking loop
-
-                        # Try to check contact page
-                        try:
-                            contact_page_links = page.locator(
-                                "a:text-matches('contact|nous trouver|find us|location', 'i')"
-                            )
-                            if contact_page_links.count() > 0:
-                                contact_link_element = contact_page_links.first
-                                contact_url_relative = (
-                                    contact_link_element.get_attribute("href")
+                            else:
+                                contact_match_results = self.check_address_match(
+                                    contact_text, merchant, precleaned=True
                                 )
-                                if contact_url_relative:
-                                    contact_url_absolute = urljoin(
-                                        page.url, contact_url_relative
-                                    )
+                                if (
+                                    verification_result is None
+                                    or contact_match_results["confidence"]
+                                    > verification_result["address_match_confidence"]
+                                ):
                                     logger.info(
-                                        f"Found potential contact page: {contact_url_absolute}"
+                                        f"Contact page has better match: {contact_match_results['confidence']}%"
                                     )
-
-                                    page.goto(
-                                        contact_url_absolute,
-                                        timeout=15000,
-                                        wait_until="domcontentloaded",
-                                    )
-                                    time.sleep(2)
-                                    contact_screenshot_path = os.path.join(
-                                        self.screenshots_dir,
-                                        f"contact_page_{websites_checked}.png",
+                                    # Use the contact page data for the result
+                                    verification_result = (
+                                        self._build_verification_result(
+                                            contact_match_results,
+                                            page.url,
+                                            contact_title,
+                                            contact_screenshot_path,
+                                        )
                                     )
-                                    page.screenshot(path=contact_screenshot_path)
+                                    verification_result["is_contact_page"] = True
+                except Exception as e_contact:
+                    logger.warning(f"Error checking contact page: {str(e_contact)}")
 
-                                    contact_content = page.content()
-                                    contact_match_results = self.check_address_match(
-                                        contact_content, merchant_data
-                                    )
+                if verification_result is None:
+                    return {"unscored_pages": unscored_pages}
+                if (
+                    verification_result["address_match_confidence"]
+                    < _NO_POSTCODE_MAX_CONFIDENCE
+                ):
+                    verification_result = self._score_unscored_pages(
+                        unscored_pages, merchant, verification_result
+                    )
+                return verification_result
+            except Exception as e_site:
+                logger.error(f"Error processing website {url}: {str(e_site)}")
+                return None
 
-                                    if (
-                                        contact_match_results["confidence"]
-                                        > current_verification_result[
-                                            "address_match_confidence"
-                                        ]
-                                    ):
-                                        logger.info(
-                                            f"Contact page has better match: {contact_match_results['confidence']}%"
-                                        )
-                                        # Update the current result with contact page data
-                                        verification_results[-1].update(
-                                            {
-                                                "url": page.url,
-                                                "title": page.title(),
-                                                "address_found": contact_match_results[
-                                                    "has_address"
-                                                ]
-                                                or contact_match_results["has_town"]
-                                                or contact_match_results[
-                                                    "has_postcode"
-                                                ],
-                                                "address_match": contact_match_results[
-                                                    "matching_text"
-                                                ],
-                                                "address_match_confidence": contact_match_results[
-                                                    "confidence"
-                                                ],
-                                                "screenshot_path": contact_screenshot_path,
-                                                "verified": contact_match_results[
-                                                    "confidence"
-                                                ]
-                                                > 50,
-                                                "is_contact_page": True,
-                                            }
-                                        )
-                                        if contact_match_results["confidence"] > 70:
-                                            logger.info(
-                                                "Found high confidence match on contact page, stopping search."
-                                            )
-                                            break  # Break from website checking loop
-                        except Exception as e_contact:
-                            logger.warning(
-                                f"Error checking contact page: {str(e_contact)}"
-                            )
-                    except Exception as e_site:
-                        logger.error(f"Error processing website {url}: {str(e_site)}")
-                        continue
+    async def find_and_verify_merchant(
+        self, merchant_data: Dict[str, Any], max_websites: int = 5
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find merchant website and verify address information.
+
+        Candidate websites are checked concurrently, each on a page borrowed
+        from the verifier's page pool, until one gives a high confidence match.
+
+        Args:
+            merchant_data: Dictionary containing merchant information
+            max_websites: Maximum number of websites to check
+
+        Returns:
+            Dictionary with verification results or None if verification failed
+        """
+        logger.info(
+            f"Starting verification for merchant: {merchant_data['merchant_name']}"
+        )
+
+        # Prepare search query including name, location, and "site" to prioritize official sites
+        search_query = f"{merchant_data['merchant_name']} {merchant_data['town']} {merchant_data['country']} site"
 
-            # Return best result if we have any
-            if verification_results:
-                best_result = max(
-                    verification_results,
-                    key=lambda x: x.get("address_match_confidence", 0),
+        try:
+            # Search on a pooled page, returned before the site checks so
+            # they can use it
+            async with self._pooled_page() as page:
+                # Step 1: Search for the merchant
+                search_success, search_results = await self._cached_search(
+                    search_query, page
                 )
-                return best_result
 
-            return None
+                # Step 2: If search failed, try direct URL guessing
+                if not search_success or not search_results:
+                    direct_success, direct_result = await self.try_direct_url_guessing(
+                        merchant_data, page
+                    )
+                    if direct_success and direct_result:
+                        search_success = True
+                        search_results = [direct_result]
+
+            if not search_success or not search_results:
+                return None
+
+            # Step 3: Check the candidate websites concurrently, cleaning the
+            # merchant's address once for all of them
+            merchant = self.normalize_merchant(merchant_data)
+            logger.info(f"Found {len(search_results)} potential websites to check.")
+            candidate_urls = [
+                result["url"]
+                for result in search_results
+                if not self.is_social_media(result["url"])
+            ][:max_websites]
+
+            tasks = [
+                asyncio.create_task(
+                    self._check_site(url, site_number, merchant_data, merchant)
+                )
+                for site_number, url in enumerate(candidate_urls, start=1)
+            ]
+            # Take results as they finish, keeping the best so far; a high
+            # confidence match makes the remaining checks pointless, so cancel them
+            best_result = None
+            unscored_pages = []
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    result = await next_result
+                    if not result:
+                        continue
+                    if "unscored_pages" in result:
+                        unscored_pages.extend(result["unscored_pages"])
+                        continue
+                    if (
+                        best_result is None
+                        or result["address_match_confidence"]
+                        > best_result["address_match_confidence"]
+                    ):
+                        best_result = result
+                    if result["address_match_confidence"] > 70:
+                        logger.info(
+                            "Found high confidence match, cancelling remaining website checks."
+                        )
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # Let cancelled checks return their pages to the pool
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            # No page showed the postcode, or those that did matched too little
+            # to beat the pages without it: score those pages fully as well
+            if (
+                best_result is None
+                or best_result["address_match_confidence"] < _NO_POSTCODE_MAX_CONFIDENCE
+            ):
+                best_result = self._score_unscored_pages(
+                    unscored_pages, merchant, best_result
+                )
+
+            return best_result
 
         except Exception as e:
             logger.error(f"Error during merchant verification: {str(e)}")
             return None
         finally:
-            if "page" in locals():
-                try:
-                    page.close()
-                except Exception:
-                    pass
+            await self._merchant_done()
+
+    async def verify_batch(
+        self, merchants: List[Dict[str, Any]], max_concurrency: int = 5
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Verify several merchants concurrently.
+
+        Args:
+            merchants: List of merchant information dictionaries
+            max_concurrency: Maximum number of merchants verified at the same time
+
+        Returns:
+            Verification results in the same order as merchants
+        """
+        merchant_semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def verify_one(merchant_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with merchant_semaphore:
+                return await self.find_and_verify_merchant(merchant_data)
+
+        return await asyncio.gather(*(verify_one(m) for m in merchants))
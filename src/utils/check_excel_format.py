@@ -14,8 +14,60 @@ matches what is expected by the merchant verification application.
 import os
 import sys
 
-# Third-party Library imports
-import pandas as pd
+# Source sheet columns the application reads, and what they hold
+MERCHANT_COLUMNS = {
+    16: "merchant_id",
+    18: "merchant_name",
+    30: "address",
+    31: "postcode",
+}
+
+# Rows read for the structure preview; the whole sheet is only read once the
+# preview shows the format is usable
+PREVIEW_ROWS = 5
+
+# Workbook formats openpyxl can stream in read-only mode
+_OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm", ".xltx", ".xltm")
+_OPENPYXL_READ_ONLY_KWARGS = {"read_only": True, "data_only": True, "keep_links": False}
+
+
+def _read_merchant_columns(file_path, nrows=None):
+    """
+    Read only the merchant columns of the first worksheet.
+
+    Whole sheets are parsed with calamine. When only the first rows are
+    wanted, workbooks openpyxl understands are streamed in read-only mode
+    instead, which stops parsing after those rows. Sheets too narrow to have
+    every merchant column are read whole and cut down to the ones they have.
+
+    Args:
+        file_path: Path to the Excel file
+        nrows: Number of rows to read after the header (None for all)
+
+    Returns:
+        Tuple of (DataFrame whose columns are labelled with their source
+        column positions, total column count or None if only the merchant
+        columns were read)
+    """
+    import pandas as pd
+    from pandas.errors import ParserError
+
+    read_kwargs = {"engine": "calamine", "nrows": nrows}
+    if nrows is not None and file_path.lower().endswith(_OPENPYXL_EXTENSIONS):
+        read_kwargs.update(engine="openpyxl", engine_kwargs=_OPENPYXL_READ_ONLY_KWARGS)
+
+    try:
+        df = pd.read_excel(file_path, usecols=list(MERCHANT_COLUMNS), **read_kwargs)
+        df.columns = list(MERCHANT_COLUMNS)
+        return df, None
+    except ParserError:
+        # usecols rejects positions past the last column
+        df = pd.read_excel(file_path, **read_kwargs)
+        available = [j for j in MERCHANT_COLUMNS if j < df.shape[1]]
+        column_count = df.shape[1]
+        df = df.iloc[:, available]
+        df.columns = available
+        return df, column_count
 
 
 def check_excel_format(file_path):
@@ -32,49 +84,34 @@ def check_excel_format(file_path):
         print(f"Error: File not found: {file_path}")
         return False
 
+    # Imported here so the usage and missing-file paths return quickly
+    import pandas as pd
+
     try:
-        # Load Excel file with pandas
-        print("Loading Excel file...")
-        df = pd.read_excel(file_path)
-        print(f"Loaded Excel with {df.shape[0]} rows and {df.shape[1]} columns")
+        # Load the first rows of the merchant columns with pandas
+        print("Loading first rows of Excel file...")
+        preview, column_count = _read_merchant_columns(file_path, nrows=PREVIEW_ROWS)
 
         # Print the first few rows to see the structure (showing relevant columns)
         print("\nFirst few rows (showing merchant-relevant columns):")
-        for i in range(min(5, df.shape[0])):
-            row_data = {}
-            if df.shape[1] > 16:
-                row_data["col_16_merchant_id"] = df.iloc[i, 16]
-            if df.shape[1] > 18:
-                row_data["col_18_merchant_name"] = df.iloc[i, 18]
-            if df.shape[1] > 30:
-                row_data["col_30_address"] = df.iloc[i, 30]
-            if df.shape[1] > 31:
-                row_data["col_31_postcode"] = df.iloc[i, 31]
-
+        for i, record in enumerate(preview.to_dict(orient="records")):
+            row_data = {
+                f"col_{j}_{MERCHANT_COLUMNS[j]}": value for j, value in record.items()
+            }
             print(f"Row {i}: {row_data}")
 
         # Analyze header and data rows
         print("\nAnalyzing file structure:")
-        if df.shape[1] > 18:
-            print(
-                f"Row 0 (Header): Column 16={df.iloc[0, 16]}, Column 18={df.iloc[0, 18]}"
-            )
-            if df.shape[0] > 1:
-                print(
-                    f"Row 1 (Data 1): Column 16={df.iloc[1, 16]}, Column 18={df.iloc[1, 18]}"
-                )
-            if df.shape[0] > 2:
-                print(
-                    f"Row 2 (Data 2): Column 16={df.iloc[2, 16]}, Column 18={df.iloc[2, 18]}"
-                )
+        if 18 in preview.columns:
+            labels = ["Row 0 (Header)", "Row 1 (Data 1)", "Row 2 (Data 2)"]
+            for label, merchant_id, merchant_name in zip(
+                labels, preview[16], preview[18]
+            ):
+                print(f"{label}: Column 16={merchant_id}, Column 18={merchant_name}")
 
         # Try to extract data as the real application would
         print("\nAttempting to extract data as the application would...")
 
-        # Skip header row (1 row) - matching the actual data_extractor.py logic
-        data_rows = df.iloc[1:].reset_index(drop=True)
-        print(f"After skipping 1 header row, we have {len(data_rows)} data rows")
-
         # Print the key column indices to verify
         print("\nKey columns used by the application:")
         print("merchant_id: Column index 16")
@@ -83,54 +120,66 @@ def check_excel_format(file_path):
         print("postcode: Column index 31 (if available)")
 
         # Check if required columns exist
-        if df.shape[1] <= 18:
+        if 18 not in preview.columns:
             print(
-                f"\nError: Excel file doesn't have enough columns. Need at least 19 columns, got {df.shape[1]}"
+                f"\nError: Excel file doesn't have enough columns. Need at least 19 columns, got {column_count}"
             )
             return False
 
+        # Skip header row (1 row) - matching the actual data_extractor.py logic;
+        # the preview holds every row when it came back short
+        if len(preview) <= 1:
+            print("\nWarning: No data rows found after skipping headers!")
+            return False
+
         # Extract sample data from required columns
-        if len(data_rows) > 0:
-            print("\nSample data from first merchant (first data row):")
-            sample = {
-                "merchant_id": data_rows.iloc[0, 16]
-                if data_rows.shape[1] > 16
-                else "N/A",
-                "merchant_name": data_rows.iloc[0, 18]
-                if data_rows.shape[1] > 18
-                else "N/A",
-                "address": data_rows.iloc[0, 30] if data_rows.shape[1] > 30 else "N/A",
-                "postcode": data_rows.iloc[0, 31] if data_rows.shape[1] > 31 else "N/A",
-            }
+        print("\nSample data from first merchant (first data row):")
+        first_row = preview.iloc[1]
+        sample = {
+            name: first_row[j] if j in preview.columns else "N/A"
+            for j, name in MERCHANT_COLUMNS.items()
+        }
+
+        for key, value in sample.items():
+            print(f"{key}: {value}")
+
+        # Check for missing essential data
+        missing = [
+            key
+            for key, value in sample.items()
+            if key in ["merchant_id", "merchant_name"]
+            and (pd.isna(value) or value == "")
+        ]
+        if missing:
+            print(f"\nWarning: Missing data for essential fields: {missing}")
+            return False
 
-            for key, value in sample.items():
-                print(f"{key}: {value}")
-
-            # Check for missing essential data
-            missing = [
-                key
-                for key, value in sample.items()
-                if key in ["merchant_id", "merchant_name"]
-                and (pd.isna(value) or value == "")
-            ]
-            if missing:
-                print(f"\nWarning: Missing data for essential fields: {missing}")
-                return False
-
-            # List all merchants found in the file
-            print("\nAll merchants found in the file:")
-            for i in range(len(data_rows)):
-                if data_rows.shape[1] > 18:
-                    merchant_id = data_rows.iloc[i, 16]
-                    merchant_name = data_rows.iloc[i, 18]
-                    if not pd.isna(merchant_id) and not pd.isna(merchant_name):
-                        print(f"  Merchant {i + 1}: {merchant_id} - {merchant_name}")
-
-            print("\nExcel file structure appears compatible with the application.")
-            return True
+        # The preview looks right, so now read every row
+        print("\nLoading all rows of Excel file...")
+        df, column_count = _read_merchant_columns(file_path)
+        if column_count is None:
+            print(
+                f"Loaded Excel with {df.shape[0]} rows "
+                f"(merchant columns {', '.join(map(str, MERCHANT_COLUMNS))})"
+            )
         else:
-            print("\nWarning: No data rows found after skipping headers!")
-            return False
+            print(f"Loaded Excel with {df.shape[0]} rows and {column_count} columns")
+
+        data_rows = df.iloc[1:].reset_index(drop=True)
+        print(f"After skipping 1 header row, we have {len(data_rows)} data rows")
+
+        # List all merchants found in the file
+        print("\nAll merchants found in the file:")
+        # Rows missing an ID or name are dropped in one pass; the index
+        # still gives each merchant's position among the data rows
+        merchants = data_rows[[16, 18]].dropna()
+        for i, merchant_id, merchant_name in zip(
+            merchants.index, merchants[16], merchants[18]
+        ):
+            print(f"  Merchant {i + 1}: {merchant_id} - {merchant_name}")
+
+        print("\nExcel file structure appears compatible with the application.")
+        return True
 
     except Exception as e:
         print(f"Error analyzing Excel file: {str(e)}")
@@ -14,8 +14,68 @@ to help determine where the merchant data actually starts.
 import sys
 import os
 
-# Third-party library imports
-import pandas as pd
+# Columns 16, 18, 30, 31 hold merchant_id, name, address and postcode
+SAMPLE_COLUMNS = (16, 18, 30, 31)
+
+# Workbook formats openpyxl can stream in read-only mode
+_OPENPYXL_EXTENSIONS = (".xlsx", ".xlsm", ".xltx", ".xltm")
+
+
+def _peek_rows(file_path, sheet_name, num_rows):
+    """
+    Read the size of a worksheet and the sample columns of its first rows.
+
+    Workbooks openpyxl understands are streamed in read-only mode, so only
+    the first rows are parsed; other formats are loaded whole with pandas.
+    As with pd.read_excel, the first sheet row is taken as the header.
+
+    Args:
+        file_path: Path to the Excel file
+        sheet_name: Name of the worksheet to read
+        num_rows: Number of data rows to return
+
+    Returns:
+        Tuple of (data row count, column count, rows), where each row is a
+        tuple of the SAMPLE_COLUMNS values, None for empty cells
+    """
+    first_col, last_col = SAMPLE_COLUMNS[0], SAMPLE_COLUMNS[-1]
+
+    if file_path.lower().endswith(_OPENPYXL_EXTENSIONS):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(
+            file_path, read_only=True, data_only=True, keep_links=False
+        )
+        try:
+            sheet = workbook[sheet_name]
+            if not (sheet.max_row and sheet.max_column):
+                # No stored dimensions; scan the sheet to size it
+                sheet.calculate_dimension(force=True)
+            row_count, column_count = sheet.max_row - 1, sheet.max_column
+            rows = [
+                tuple(row[j - first_col] for j in SAMPLE_COLUMNS)
+                for row in sheet.iter_rows(
+                    min_row=2,
+                    max_row=num_rows + 1,
+                    min_col=first_col + 1,
+                    max_col=last_col + 1,
+                    values_only=True,
+                )
+            ]
+        finally:
+            workbook.close()
+        return row_count, column_count, rows
+
+    import pandas as pd
+
+    df = pd.read_excel(file_path, sheet_name=sheet_name, engine="calamine")
+    rows = []
+    if last_col < df.shape[1]:
+        sample = df.iloc[:num_rows, list(SAMPLE_COLUMNS)].astype(object)
+        rows = list(
+            sample.where(sample.notna(), None).itertuples(index=False, name=None)
+        )
+    return df.shape[0], df.shape[1], rows
 
 
 def check_excel_rows(file_path, num_rows=10):
@@ -33,54 +93,54 @@ def check_excel_rows(file_path, num_rows=10):
         print(f"Error: File not found: {file_path}")
         return
 
+    # numpy is only needed once the file is known to exist
+    import numpy as np
+
     try:
-        # Load Excel file
-        df = pd.read_excel(file_path, sheet_name="Sheet1")
-        print(f"File has {df.shape[0]} rows and {df.shape[1]} columns total")
+        # Only the first rows are parsed, plus the sheet size
+        row_count, column_count, rows = _peek_rows(file_path, "Sheet1", num_rows)
+        print(f"File has {row_count} rows and {column_count} columns total")
 
         # Show the structure of the first few rows
-        max_rows = min(num_rows, df.shape[0])
+        max_rows = min(num_rows, row_count)
         print(f"\nShowing first {max_rows} rows structure:")
 
-        for i in range(max_rows):
-            # Get a sample of values from this row
-            # Check columns 16, 18, 30, 31 (merchant_id, name, address, postcode)
-            sample_cols = (
-                [16, 18, 30, 31] if i < df.shape[0] and 31 < df.shape[1] else []
-            )
-
-            if sample_cols:
-                sample_values = {
-                    f"col_{j}": str(df.iloc[i, j]) if j < df.shape[1] else "N/A"
-                    for j in sample_cols
-                }
-
-                print(f"\nRow {i + 1} (index {i}):")
-                print(f"  merchant_id (col_16): {sample_values.get('col_16', 'N/A')}")
-                print(f"  merchant_name (col_18): {sample_values.get('col_18', 'N/A')}")
-                print(f"  address (col_30): {sample_values.get('col_30', 'N/A')}")
-                print(f"  postcode (col_31): {sample_values.get('col_31', 'N/A')}")
-
-                # Determine if this looks like a header or data row
-                is_header = all(
-                    isinstance(val, str)
-                    and val.strip()
-                    and not val.strip().isdigit()
-                    and len(val.strip()) < 30
-                    for val in sample_values.values()
-                )
-
-                is_empty = all(
-                    not str(val).strip() or str(val).strip().lower() == "nan"
-                    for val in sample_values.values()
-                )
-
-                if is_empty:
-                    print("  ⚠️ This row appears to be EMPTY")
-                elif is_header:
-                    print("  ⚠️ This row might be a HEADER row")
-                else:
-                    print("  ✓ This row appears to contain MERCHANT DATA")
+        # Rows are only sampled when the sheet reaches column 31
+        if SAMPLE_COLUMNS[-1] >= column_count:
+            rows = []
+
+        # Sample values as text, "nan" for empty cells, one row per sampled row
+        samples = np.array(
+            [
+                ["nan" if value is None else str(value) for value in row]
+                for row in rows[:max_rows]
+            ],
+            dtype=str,
+        ).reshape(-1, len(SAMPLE_COLUMNS))
+
+        # Classify every row at once: a header has short, non-numeric text in
+        # each column; an empty row has nothing but blanks and "nan"
+        stripped = np.char.strip(samples)
+        lengths = np.char.str_len(stripped)
+        is_header = ((lengths > 0) & ~np.char.isdigit(stripped) & (lengths < 30)).all(
+            axis=1
+        )
+        is_empty = ((lengths == 0) | (np.char.lower(stripped) == "nan")).all(axis=1)
+
+        for i, sample in enumerate(samples):
+            merchant_id, merchant_name, address, postcode = sample
+            print(f"\nRow {i + 1} (index {i}):")
+            print(f"  merchant_id (col_16): {merchant_id}")
+            print(f"  merchant_name (col_18): {merchant_name}")
+            print(f"  address (col_30): {address}")
+            print(f"  postcode (col_31): {postcode}")
+
+            if is_empty[i]:
+                print("  ⚠️ This row appears to be EMPTY")
+            elif is_header[i]:
+                print("  ⚠️ This row might be a HEADER row")
+            else:
+                print("  ✓ This row appears to contain MERCHANT DATA")
 
         print("\nBased on this analysis:")
         print(
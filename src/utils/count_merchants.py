@@ -13,14 +13,20 @@ first few records to help verify the data structure.
 # Standard library imports
 import sys
 import os
-import pandas as pd
 import logging
 
-# Third-party library imports
+# Local imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-from src.data_extractor import extract_merchant_data
 from src.config.logging_config import setup_logging
 
+# Source sheet columns the application reads, and what they hold
+MERCHANT_COLUMNS = {
+    16: "merchant_id",
+    18: "merchant_name",
+    30: "address",
+    31: "postcode",
+}
+
 
 def debug_excel_file(file_path):
     """
@@ -29,10 +35,12 @@ def debug_excel_file(file_path):
     Args:
         file_path: Path to the Excel file
     """
+    import pandas as pd
+
     print("\n==== DEBUGGING EXCEL FILE STRUCTURE ====")
     try:
         # Read the raw Excel file
-        df = pd.read_excel(file_path)
+        df = pd.read_excel(file_path, engine="calamine")
 
         # Print basic stats
         print(f"Total rows in Excel: {len(df)}")
@@ -40,17 +48,13 @@ def debug_excel_file(file_path):
 
         # Print all rows with the actual column indices used by the application
         print("\nAll rows (showing merchant-relevant columns):")
-        for i in range(len(df)):
+        shown_columns = [j for j in MERCHANT_COLUMNS if j < df.shape[1]]
+        rows = df.iloc[:, shown_columns].itertuples(index=False, name=None)
+        for i, row in enumerate(rows):
             print(f"Row {i}:")
             # Show the actual columns that the application uses
-            if df.shape[1] > 16:
-                print(f"  Column 16 (merchant_id): {df.iloc[i, 16]}")
-            if df.shape[1] > 18:
-                print(f"  Column 18 (merchant_name): {df.iloc[i, 18]}")
-            if df.shape[1] > 30:
-                print(f"  Column 30 (address): {df.iloc[i, 30]}")
-            if df.shape[1] > 31:
-                print(f"  Column 31 (postcode): {df.iloc[i, 31]}")
+            for j, value in zip(shown_columns, row):
+                print(f"  Column {j} ({MERCHANT_COLUMNS[j]}): {value}")
 
         print("==== END OF EXCEL STRUCTURE DEBUG ====\n")
     except Exception as e:
@@ -71,6 +75,9 @@ def count_merchants(file_path):
         print(f"Error: File not found: {file_path}")
         return
 
+    # Pulls in pandas, so only import once there is a file to read
+    from src.data_extractor import extract_merchant_data
+
     # First debug the raw Excel structure
     debug_excel_file(file_path)
 
@@ -97,15 +104,16 @@ def count_merchants(file_path):
         # Print the first few merchants
         if count > 0:
             print("\nHere are all the merchants:")
-            for i, (_, merchant) in enumerate(merchants_df.iterrows()):
-                print(f"\nMerchant {i + 1}:")
-                print(f"  ID: {merchant['merchant_id']}")
-                print(f"  Name: {merchant['merchant_name']}")
-                print(f"  Legal Name: {merchant['merchant_legal_name']}")
-                print(f"  Industry: {merchant['industry']}")
-                print(f"  Country: {merchant['country']}")
+            merchants = merchants_df.itertuples(index=False)
+            for i, merchant in enumerate(merchants, 1):
+                print(f"\nMerchant {i}:")
+                print(f"  ID: {merchant.merchant_id}")
+                print(f"  Name: {merchant.merchant_name}")
+                print(f"  Legal Name: {merchant.merchant_legal_name}")
+                print(f"  Industry: {merchant.industry}")
+                print(f"  Country: {merchant.country}")
                 print(
-                    f"  Address: {merchant['address_line1']}, {merchant['town']}, {merchant['postcode']}"
+                    f"  Address: {merchant.address_line1}, {merchant.town}, {merchant.postcode}"
                 )
         else:
             print(
@@ -20,6 +20,7 @@ from typing import Dict, List, Optional, Any, Tuple
 # Third-party imports
 from playwright.sync_api import sync_playwright, Page
 import requests
+from requests.adapters import HTTPAdapter
 
 # Local imports
 from src.config.logging_config import get_logger
@@ -27,6 +28,9 @@ from src.config.logging_config import get_logger
 # Initialize logger
 logger = get_logger(__name__)
 
+# Shared keep-alive session for HTTP checks made without a browser
+_http_session: Optional[requests.Session] = None
+
 
 class WebAutomator:
     """
@@ -399,6 +403,26 @@ class WebAutomator:
             # Not treating this as an error, just a timeout
 
 
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for requests made without a browser.
+
+    Reusing one session keeps connections alive between requests, so repeat
+    requests to a host skip the TCP and TLS handshakes.
+
+    Returns:
+        Shared requests session
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
 def check_url_accessibility(url: str, timeout: int = 10) -> Dict[str, Any]:
     """
     Check if a URL is accessible without using a browser.
@@ -421,7 +445,7 @@ def check_url_accessibility(url: str, timeout: int = 10) -> Dict[str, Any]:
 
     try:
         start_time = time.time()
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
+        response = get_http_session().head(url, timeout=timeout, allow_redirects=True)
         end_time = time.time()
 
         result["response_time"] = round((end_time - start_time) * 1000)  # ms
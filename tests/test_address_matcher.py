@@ -7,6 +7,38 @@ from src.address_matcher import (
 )
 
 
+def test_normalize_address_expands_whole_word_abbreviations():
+    """Test that abbreviations are expanded without touching longer words."""
+    assert normalize_address("12 West St., London") == "12 west street london"
+    assert normalize_address("1 Oak Rd") == "1 oak road"
+    assert normalize_address("5 Fairst Ln.") == "5 fairst lane"
+
+
+def test_find_best_address_match_agrees_with_compare_addresses():
+    """Test that batched scoring picks the same best candidate as pairwise scoring."""
+    reference_address = {
+        "address_line1": "789 Oxford Street",
+        "town": "London",
+        "postcode": "W1D 2BS",
+        "country": "UK",
+    }
+    text = """
+    Our office is located at 456 Park Avenue, New York, NY 10022.
+    We also have a branch at 789 Oxford Street, London, W1D 2BS.
+    Contact us at 123 Main St, Boston, MA 02108.
+    """
+    expected = max(
+        compare_addresses(reference_address, addr)[0]
+        for addr in extract_addresses_from_text(text)
+    )
+
+    best_score, best_match = find_best_address_match(reference_address, text)
+
+    assert best_score == expected
+    assert best_match is not None
+    assert "W1D 2BS" in best_match
+
+
 def main():
     # Example 1: Normalize an address
     address = "123 Main St., London, UK, SW1A 1AA"
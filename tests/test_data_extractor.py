@@ -6,6 +6,7 @@ from src.data_extractor import (
     extract_merchant_data,
     _clean_merchant_data,
     get_merchant_by_id,
+    index_merchants_by_id,
     filter_merchants,
     export_merchants_to_excel,
 )
@@ -74,6 +75,53 @@ def test_extract_merchant_data_file_not_found():
         extract_merchant_data("nonexistent_file.xlsx")
 
 
+def test_extract_merchant_data_uses_parquet_cache(tmp_path, monkeypatch):
+    """Test that a parsed workbook is cached and reused while unchanged."""
+    monkeypatch.delenv("MERCHANT_VERIFIER_CACHE_DIR", raising=False)
+    rows = [[f"header_{i}" for i in range(32)], [""] * 32]
+    for n in range(1, 3):
+        row = [""] * 32
+        row[16], row[18], row[30], row[31] = f"MERCH00{n}", f"Store {n}", "", ""
+        rows.append(row)
+    excel_path = str(tmp_path / "merchants.xlsx")
+    pd.DataFrame(rows[1:], columns=rows[0]).to_excel(excel_path, index=False)
+    cache_dir = tmp_path / "cache"
+
+    # The cache is opt-in
+    extract_merchant_data(excel_path)
+    assert not cache_dir.exists()
+    assert not list(tmp_path.glob("*.parquet"))
+
+    first = extract_merchant_data(excel_path, cache_dir=str(cache_dir))
+    assert len(list(cache_dir.glob("merchants.xlsx-*.parquet"))) == 1
+
+    second = extract_merchant_data(excel_path, cache_dir=str(cache_dir))
+    pd.testing.assert_frame_equal(first, second)
+    assert second["merchant_id"].tolist() == ["MERCH001", "MERCH002"]
+
+    # Editing the workbook replaces its cache entry
+    rows[2][18] = "Store One"
+    pd.DataFrame(rows[1:], columns=rows[0]).to_excel(excel_path, index=False)
+    third = extract_merchant_data(excel_path, cache_dir=str(cache_dir))
+    assert third["merchant_name"].tolist() == ["Store One", "Store 2"]
+    assert len(list(cache_dir.glob("merchants.xlsx-*.parquet"))) == 1
+
+
+def test_extract_merchant_data_mixed_id_types(tmp_path):
+    """Test that numeric and text merchant IDs in one column are read as text."""
+    rows = [[""] * 32, [""] * 32, [""] * 32]
+    rows[1][16], rows[1][18] = 1001, "Store 1"
+    rows[2][16], rows[2][18] = "MERCH002", "Store 2"
+    excel_path = str(tmp_path / "merchants.xlsx")
+    pd.DataFrame(rows, columns=[f"col_{i}" for i in range(32)]).to_excel(
+        excel_path, index=False
+    )
+
+    df = extract_merchant_data(excel_path)
+
+    assert df["merchant_id"].tolist() == ["1001", "MERCH002"]
+
+
 def test_clean_merchant_data(sample_merchants_df):
     """Test cleaning merchant data."""
     # Add some problematic data
@@ -108,6 +156,7 @@ def test_clean_merchant_data(sample_merchants_df):
     assert len(cleaned_df) == 3  # Should remove empty and duplicate IDs
     assert "MERCH001" in cleaned_df["merchant_id"].values
     assert "" not in cleaned_df["merchant_id"].values
+    assert isinstance(cleaned_df.index, pd.RangeIndex)
 
 
 def test_get_merchant_by_id(sample_merchants_df):
@@ -122,6 +171,18 @@ def test_get_merchant_by_id(sample_merchants_df):
     assert merchant is None
 
 
+def test_get_merchant_by_id_on_indexed_data(sample_merchants_df):
+    """Test retrieving merchant by ID from a merchant_id-indexed frame."""
+    indexed_df = index_merchants_by_id(_clean_merchant_data(sample_merchants_df))
+
+    merchant = get_merchant_by_id(indexed_df, "MERCH002")
+    assert merchant is not None
+    assert merchant["merchant_id"] == "MERCH002"
+    assert merchant["merchant_name"] == "Store 2"
+
+    assert get_merchant_by_id(indexed_df, "NONEXISTENT") is None
+
+
 def test_filter_merchants(sample_merchants_df):
     """Test filtering merchants."""
     # Test exact match
@@ -137,6 +198,24 @@ def test_filter_merchants(sample_merchants_df):
     )
     assert len(filtered_df) == 3
 
+    # Test matching any of several values
+    filtered_df = filter_merchants(
+        sample_merchants_df, {"address_line1": ["main", "pine"]}, exact_match=False
+    )
+    assert filtered_df["merchant_id"].tolist() == ["MERCH001", "MERCH003"]
+
+    filtered_df = filter_merchants(
+        sample_merchants_df, {"merchant_id": {"MERCH002", "MERCH003"}}
+    )
+    assert len(filtered_df) == 2
+
+    # An empty list of alternatives matches nothing in either mode
+    for exact_match in (True, False):
+        filtered_df = filter_merchants(
+            sample_merchants_df, {"merchant_name": []}, exact_match=exact_match
+        )
+        assert len(filtered_df) == 0
+
 
 def test_export_merchants_to_excel(sample_merchants_df):
     """Test exporting merchants to Excel."""
@@ -151,3 +230,45 @@ def test_export_merchants_to_excel(sample_merchants_df):
 
         # Clean up
         os.unlink(output_path)
+
+
+def test_export_merchants_to_parquet(sample_merchants_df, tmp_path):
+    """Test exporting merchants to Parquet based on the file extension."""
+    output_path = export_merchants_to_excel(
+        sample_merchants_df, str(tmp_path / "merchants.parquet")
+    )
+
+    exported_df = pd.read_parquet(output_path)
+    pd.testing.assert_frame_equal(exported_df, sample_merchants_df)
+
+
+def test_export_merchants_to_feather(sample_merchants_df, tmp_path):
+    """Test exporting merchants to Feather with an explicit format."""
+    cleaned_df = _clean_merchant_data(sample_merchants_df)
+    output_path = export_merchants_to_excel(
+        cleaned_df, str(tmp_path / "merchants.arrow"), file_format="feather"
+    )
+
+    exported_df = pd.read_feather(output_path)
+    assert exported_df["merchant_id"].tolist() == ["MERCH001", "MERCH002", "MERCH003"]
+
+    with pytest.raises(ValueError):
+        export_merchants_to_excel(cleaned_df, output_path, file_format="csv")
+
+    # Unknown extensions are rejected rather than written as xlsx
+    with pytest.raises(ValueError):
+        export_merchants_to_excel(cleaned_df, str(tmp_path / "merchants.csv"))
+    assert not (tmp_path / "merchants.csv").exists()
+
+
+def test_export_merchants_excel_variants(sample_merchants_df, tmp_path):
+    """Test that format names are case-insensitive and .xlsm is written as Excel."""
+    output_path = export_merchants_to_excel(
+        sample_merchants_df, str(tmp_path / "merchants.xlsx"), file_format="XLSX"
+    )
+    assert len(pd.read_excel(output_path)) == 3
+
+    output_path = export_merchants_to_excel(
+        sample_merchants_df, str(tmp_path / "merchants.xlsm")
+    )
+    assert len(pd.read_excel(output_path)) == 3
@@ -0,0 +1,423 @@
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+from src import merchant_verifier
+from src.merchant_verifier import (
+    AsyncMerchantVerifier,
+    NormalizedMerchant,
+    _TTLCache,
+    _detect_blocked_page,
+    _host_in,
+    _is_excluded_host,
+)
+
+
+# Test fixtures
+@pytest.fixture
+def verifier(tmp_path):
+    """Create a verifier without starting a browser."""
+    return AsyncMerchantVerifier(screenshots_dir=str(tmp_path))
+
+
+@pytest.fixture
+def merchant_data():
+    """Create a sample merchant information dictionary."""
+    return {
+        "merchant_id": "MERCH001",
+        "merchant_name": "Boulangerie Dupont",
+        "address_line1": "12 Rue de la Paix",
+        "town": "Paris",
+        "postcode": "75002",
+        "country": "FRANCE",
+    }
+
+
+class _FakePage:
+    """Page stand-in recording screenshots instead of taking them."""
+
+    def __init__(self):
+        self.screenshot_paths = []
+
+    async def evaluate(self, expression, arg=None):
+        return True
+
+    async def screenshot(self, path, **kwargs):
+        self.screenshot_paths.append(path)
+
+
+class _FakePooledPage:
+    """Page stand-in whose reset navigation takes reset_delay seconds."""
+
+    def __init__(self, context):
+        self.context = context
+        self.reset_delay = 0
+        self.closed = False
+
+    async def goto(self, url, **kwargs):
+        if self.closed or self.context.closed:
+            raise RuntimeError("Target page, context or browser has been closed")
+        await asyncio.sleep(self.reset_delay)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    """Browser context stand-in handing out fake pooled pages."""
+
+    def __init__(self):
+        self.closed = False
+        self.fail_new_page = False
+
+    async def route(self, url, handler):
+        pass
+
+    async def new_page(self):
+        if self.closed or self.fail_new_page:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return _FakePooledPage(self)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    """Browser stand-in creating fake contexts."""
+
+    async def new_context(self, **kwargs):
+        return _FakeContext()
+
+
+# Test cases
+def test_check_address_match_full_match(verifier, merchant_data):
+    """Test that a page showing the whole address scores full confidence."""
+    page_content = "Contact: 12, rue de la Paix - 75002 PARIS (France)"
+
+    match_results = verifier.check_address_match(page_content, merchant_data)
+
+    assert match_results["has_address"]
+    assert match_results["has_town"]
+    assert match_results["has_postcode"]
+    assert match_results["has_country"]
+    assert match_results["confidence"] == 100
+    assert "75002" in match_results["matching_text"]
+
+
+def test_check_address_match_accepts_normalized_merchant(verifier, merchant_data):
+    """Test that dict and NormalizedMerchant inputs score a page the same way."""
+    merchant = verifier.normalize_merchant(merchant_data)
+    assert isinstance(merchant, NormalizedMerchant)
+    page_content = "Boulangerie, rue de la Paix, Paris"
+
+    from_dict = verifier.check_address_match(page_content, merchant_data)
+    from_merchant = verifier.check_address_match(page_content, merchant)
+
+    assert from_dict == from_merchant
+    assert not from_merchant["has_postcode"]
+    assert from_merchant["address_partial_match"]
+
+
+def test_check_address_match_precleaned(verifier, merchant_data):
+    """Test that precleaned text is scored like the raw text it came from."""
+    page_content = "Nous trouver : 12 Rue de la Paix, 75002 Paris."
+    page_text = verifier.clean_text(page_content)
+
+    raw = verifier.check_address_match(page_content, merchant_data)
+    precleaned = verifier.check_address_match(page_text, merchant_data, precleaned=True)
+
+    assert precleaned == raw
+    assert precleaned["confidence"] == 90
+
+
+def test_detect_blocked_page():
+    """Test CAPTCHA and interstitial detection, with CAPTCHA taking priority."""
+    assert _detect_blocked_page("Google Search") is None
+    assert _detect_blocked_page("<h1>Before you continue</h1>") == "interstitial"
+    assert _detect_blocked_page("Our systems have detected UNUSUAL TRAFFIC") == (
+        "captcha"
+    )
+    assert (
+        _detect_blocked_page("Avant de continuer ... g-recaptcha ... consent choices")
+        == "captcha"
+    )
+
+
+def test_host_in_matches_domains_and_subdomains():
+    """Test that hostnames match listed domains and any subdomain of them."""
+    domains = frozenset({"facebook.com", "bat.bing.com"})
+
+    assert _host_in("facebook.com", domains)
+    assert _host_in("m.facebook.com", domains)
+    assert _host_in("x.bat.bing.com", domains)
+    assert not _host_in("bing.com", domains)
+    assert not _host_in("notfacebook.com", domains)
+    assert not _host_in("", domains)
+
+
+def test_is_excluded_host():
+    """Test exclusion by domain and by brand under any country domain."""
+    assert _is_excluded_host("www.bing.com")
+    assert _is_excluded_host("fr.wikipedia.org")
+    assert _is_excluded_host("www.google.fr")
+    assert _is_excluded_host("www.amazon.co.uk")
+    assert not _is_excluded_host("www.boulangerie-dupont.fr")
+    # Brands only match whole labels, and never the top-level domain
+    assert not _is_excluded_host("googlefans.com")
+    assert not _is_excluded_host("example.google")
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    """Test that entries expire ttl seconds after being set."""
+    now = [1000.0]
+    monkeypatch.setattr(merchant_verifier.time, "monotonic", lambda: now[0])
+    cache = _TTLCache(ttl=10)
+
+    cache.set("query", ["result"])
+    now[0] += 5
+    assert cache.get("query") == ["result"]
+
+    now[0] += 6
+    assert cache.get("query") is None
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_evicts_oldest_entry():
+    """Test that a full cache evicts the entry set longest ago."""
+    cache = _TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)  # Setting again makes "a" the newest entry
+    cache.set("c", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4
+
+
+def test_preclean_merchants_matches_clean_text(verifier):
+    """Test that vectorized precleaning gives the same values as clean_text."""
+    merchants_df = pd.DataFrame(
+        {
+            "merchant_id": ["M1", "M2", "M3"],
+            "address_line1": [
+                "12, Rue de l'Église",
+                "  Côte-d'Or   N°5 ",
+                None,
+            ],
+            "town": ["Saint-Étienne", "DIJON", "Besançon"],
+            "postcode": ["42000", "21000", ""],
+            "country": ["FRANCE", "France", "france"],
+        }
+    )
+
+    precleaned_df = AsyncMerchantVerifier.preclean_merchants(merchants_df)
+
+    for field in ("address_line1", "town", "postcode", "country"):
+        expected = [verifier.clean_text(value) for value in merchants_df[field]]
+        assert precleaned_df[f"{field}_clean"].tolist() == expected
+    assert "address_line1_clean" not in merchants_df.columns
+
+
+def test_site_screenshots_are_named_per_merchant(verifier, merchant_data):
+    """Test that the same site number gives each merchant its own screenshot."""
+    page = _FakePage()
+    other_merchant = dict(merchant_data, merchant_id="MERCH/002")
+
+    for data in (merchant_data, other_merchant):
+        asyncio.run(verifier._capture_address_section(page, 1, data))
+
+    names = [os.path.basename(path) for path in page.screenshot_paths]
+    assert names == [
+        "MERCH001_website_1_address_section.png",
+        "MERCH_002_website_1_address_section.png",
+    ]
+
+
+def test_early_exit_keeps_page_pool_whole(tmp_path, merchant_data):
+    """Test that cancelling site checks mid-release returns their pages."""
+    verifier = AsyncMerchantVerifier(screenshots_dir=str(tmp_path), max_concurrency=3)
+    urls = ["https://site1.fr", "https://site2.fr", "https://site3.fr"]
+
+    async def fake_search(query, page):
+        return True, [{"url": url} for url in urls]
+
+    async def fake_visit(url, site_number, merchant_data, merchant):
+        async with verifier._pooled_page() as page:
+            if site_number == 1:
+                await asyncio.sleep(0.01)
+                return {"url": url, "address_match_confidence": 90}
+            # Still resetting the page when the match on site 1 cancels this
+            page.reset_delay = 0.05
+        return None
+
+    verifier._cached_search = fake_search
+    verifier._visit_site = fake_visit
+
+    async def scenario():
+        verifier.browser = _FakeBrowser()
+        await verifier._open_context()
+        for _ in range(10):
+            result = await verifier.find_and_verify_merchant(merchant_data)
+            assert result["url"] == urls[0]
+        await asyncio.gather(*verifier._page_releases)
+        return verifier._page_pool.qsize()
+
+    # A lost page makes later merchants wait forever for one
+    assert asyncio.run(asyncio.wait_for(scenario(), timeout=10)) == 3
+
+
+def _pool_pages(verifier):
+    """Return the pages waiting in the verifier's page pool."""
+    return list(verifier._page_pool._queue)
+
+
+def test_recycle_waits_for_borrowed_pages(tmp_path):
+    """Test that recycling refills the pool from the new context only."""
+    verifier = AsyncMerchantVerifier(
+        screenshots_dir=str(tmp_path), max_concurrency=2, recycle_every=1
+    )
+
+    async def scenario():
+        verifier.browser = _FakeBrowser()
+        await verifier._open_context()
+        old_context = verifier.context
+        page = await verifier._acquire_page()
+
+        recycle = asyncio.ensure_future(verifier._merchant_done())
+        await asyncio.sleep(0.01)
+        assert not recycle.done()  # Still waiting for the borrowed page
+
+        await verifier._release_page(page)
+        await recycle
+        assert old_context.closed
+        return _pool_pages(verifier), verifier.context
+
+    pages, context = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert len(pages) == 2
+    assert all(page.context is context for page in pages)
+    assert verifier._pages_out == 0
+
+
+def test_recycle_restores_lost_pages(tmp_path):
+    """Test that a page that could not be replaced is restored by the recycle."""
+    verifier = AsyncMerchantVerifier(
+        screenshots_dir=str(tmp_path), max_concurrency=3, recycle_every=1
+    )
+
+    async def scenario():
+        verifier.browser = _FakeBrowser()
+        await verifier._open_context()
+        page = await verifier._acquire_page()
+        page.closed = True  # Crashed, and no new page can replace it
+        verifier.context.fail_new_page = True
+        await verifier._release_page(page)
+        lost_qsize = verifier._page_pool.qsize()
+
+        # Nothing is borrowed, so this must not wait for the lost page
+        await asyncio.wait_for(verifier._merchant_done(), timeout=5)
+        return lost_qsize, verifier._page_pool.qsize()
+
+    lost_qsize, qsize = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert lost_qsize == 2
+    assert qsize == 3
+    assert verifier._pages_out == 0
+
+
+def test_concurrent_site_checks_share_one_visit(verifier, merchant_data):
+    """Test that a second check of a site in flight awaits the first one."""
+    visits = []
+
+    async def fake_visit(url, site_number, merchant_data, merchant):
+        visits.append(url)
+        await asyncio.sleep(0.01)
+        return {"url": url, "address_match_confidence": 90}
+
+    verifier._visit_site = fake_visit
+    merchant = verifier.normalize_merchant(merchant_data)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(
+                verifier._check_site("https://site1.fr", 1, merchant_data, merchant)
+                for _ in range(2)
+            )
+        )
+
+    results = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert visits == ["https://site1.fr"]
+    assert results[0] == results[1]
+    assert not verifier._site_checks_in_flight
+
+
+def test_weak_postcode_match_does_not_hide_better_pages(tmp_path, merchant_data):
+    """Test that a full address without the postcode beats a postcode alone."""
+    verifier = AsyncMerchantVerifier(screenshots_dir=str(tmp_path))
+    merchant = verifier.normalize_merchant(merchant_data)
+    pages = {
+        "https://site-a.fr": "12 rue de la paix paris france",
+        "https://site-b.fr": "contact 75002",
+    }
+
+    async def fake_search(query, page):
+        return True, [{"url": url} for url in pages]
+
+    async def fake_visit(url, site_number, merchant_data, merchant):
+        page_text = verifier.clean_text(pages[url])
+        if not verifier._quick_postcode_hit(page_text, merchant):
+            return {"unscored_pages": [(page_text, url, url, None, False)]}
+        return verifier._build_verification_result(
+            verifier.check_address_match(page_text, merchant, precleaned=True),
+            url,
+            url,
+            None,
+        )
+
+    verifier._cached_search = fake_search
+    verifier._visit_site = fake_visit
+
+    async def scenario():
+        verifier.browser = _FakeBrowser()
+        await verifier._open_context()
+        return await verifier.find_and_verify_merchant(merchant_data)
+
+    result = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    assert result["url"] == "https://site-a.fr"
+    assert result["address_match_confidence"] == 60
+    assert result["verified"]
+
+
+def test_site_results_are_not_shared_across_merchants(verifier, merchant_data):
+    """Test that a cached site result never carries another merchant's screenshots."""
+    visits = []
+
+    async def fake_visit(url, site_number, merchant_data, merchant):
+        visits.append(merchant_data["merchant_id"])
+        return {
+            "url": url,
+            "address_match_confidence": 90,
+            "screenshot_path": verifier._merchant_screenshot_name(
+                merchant_data, f"website_{site_number}.png"
+            ),
+        }
+
+    verifier._visit_site = fake_visit
+    other_merchant = dict(merchant_data, merchant_id="MERCH002")
+
+    async def scenario():
+        results = []
+        for data in (merchant_data, other_merchant, merchant_data):
+            merchant = verifier.normalize_merchant(data)
+            results.append(
+                await verifier._check_site("https://site1.fr", 1, data, merchant)
+            )
+        return results
+
+    results = asyncio.run(scenario())
+    assert visits == ["MERCH001", "MERCH002"]  # The repeat comes from the cache
+    assert [result["screenshot_path"] for result in results] == [
+        "MERCH001_website_1.png",
+        "MERCH002_website_1.png",
+        "MERCH001_website_1.png",
+    ]